@@ -1,17 +1,126 @@
 # analysis.py
 import os
+import fnmatch
 import hashlib
+import heapq
+import mmap
 import re
 import time
 import stat
+import threading
+from functools import partial
 from typing import Dict, List, Tuple, Set, Callable, Any
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import utils
-import navigation
 import ru_local as ru
 
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+
+_HASH_CHUNK_SIZE = 1 << 20
+_HEAD_HASH_SIZE = 64 * 1024
+_SEQUENTIAL_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+
+_INCLUDE_PATTERN = re.compile(rb'#include\s+["<]([^">]+)[">]', re.MULTILINE)
+_ES_IMPORT_PATTERN = re.compile(rb'(?:import|require)[^(]+["\']([^"\']+)["\']', re.MULTILINE)
+
+_DEP_PATTERNS: Dict[str, re.Pattern] = {
+    '.c': _INCLUDE_PATTERN,
+    '.cpp': _INCLUDE_PATTERN,
+    '.h': _INCLUDE_PATTERN,
+    '.hpp': _INCLUDE_PATTERN,
+    '.py': re.compile(rb'^(?:import|from)\s+([a-zA-Z0-9_.]+)', re.MULTILINE),
+    '.js': _ES_IMPORT_PATTERN,
+    '.ts': _ES_IMPORT_PATTERN,
+    '.java': re.compile(rb'^import\s+([a-zA-Z0-9_.]+);', re.MULTILINE)
+}
+
+_hash_buffers = threading.local()
+
+FILE_ATTRIBUTE_READONLY = 0x1
+FILE_ATTRIBUTE_HIDDEN = 0x2
+FILE_ATTRIBUTE_SYSTEM = 0x4
+FILE_ATTRIBUTE_ARCHIVE = 0x20
+FILE_ATTRIBUTE_COMPRESSED = 0x800
+FILE_ATTRIBUTE_ENCRYPTED = 0x4000
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+_WINDOWS_FILE_TYPES = {
+    '.exe': 'Executable file',
+    '.dll': 'Dynamic library',
+    '.msi': 'Installer',
+    '.bat': 'Batch file',
+    '.ps1': 'PowerShell script',
+    '.cmd': 'Command file',
+    '.docx': 'Word document',
+    '.xlsx': 'Excel spreadsheet',
+    '.pptx': 'PowerPoint presentation',
+    '.pdf': 'PDF document',
+    '.txt': 'Text file',
+    '.jpg': 'Image',
+    '.jpeg': 'Image',
+    '.png': 'Image',
+    '.gif': 'Image',
+    '.zip': 'Archive',
+    '.rar': 'Archive',
+    '.7z': 'Archive',
+    '.tar': 'Archive',
+    '.gz': 'Archive',
+    '.log': 'Log file',
+    '.ini': 'Configuration file',
+    '.sys': 'System file',
+    '.tmp': 'Temporary file'
+}
+
+WinAttrs = namedtuple('WinAttrs', ['hidden', 'system', 'readonly', 'archive', 'compressed', 'encrypted'])
+_EMPTY_ATTRS = WinAttrs(False, False, False, False, False, False)
+
+_GetFileAttributesW = None
+
+if utils.is_windows_os():
+    import ctypes
+    from ctypes import wintypes
+    
+    _GetFileAttributesW = ctypes.WinDLL('kernel32').GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+
+
+def _iter_file_entries(path: str, max_depth: int = 100):
+    """
+    Safely traverse files recursively with depth limitation using os.scandir.
+    
+    Args:
+        path: Starting directory path for traversal
+        max_depth: Maximum directory depth to descend into
+        
+    Yields:
+        os.DirEntry objects for files discovered during recursive traversal
+    """
+    stack = [(path, 0)]
+    
+    while stack:
+        current_path, current_depth = stack.pop()
+        if current_depth > max_depth:
+            continue
+        
+        try:
+            with os.scandir(current_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, current_depth + 1))
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 
 def safe_file_walk(path: str, max_depth: int = 100):
     """
@@ -24,27 +133,34 @@ def safe_file_walk(path: str, max_depth: int = 100):
     Yields:
         File paths discovered during recursive traversal
     """
-    def walk_recursive(current_path, current_depth, visited):
-        if current_depth > max_depth or current_path in visited:
-            return
-        visited.add(current_path)
-        
-        items = utils.safe_windows_listdir(current_path)
-        
-        for item in items:
-            item_path = os.path.join(current_path, item)
-            try:
-                if os.path.isdir(item_path):
-                    yield from walk_recursive(item_path, current_depth + 1, visited)
-                elif os.path.isfile(item_path):
-                    yield item_path
-            except (PermissionError, OSError):
-                continue
+    for entry in _iter_file_entries(path, max_depth):
+        yield entry.path
+
+
+def windows_attrs_from_flags(attrs: int) -> WinAttrs:
+    """
+    Decode a Windows file attribute bitmask, e.g. st_file_attributes of a stat result.
     
-    yield from walk_recursive(path, 0, set())
+    Args:
+        attrs: Attribute flags
+        
+    Returns:
+        WinAttrs named tuple with boolean values for each Windows file attribute
+    """
+    if not attrs:
+        return _EMPTY_ATTRS
+    
+    return WinAttrs(
+        hidden=bool(attrs & FILE_ATTRIBUTE_HIDDEN),
+        system=bool(attrs & FILE_ATTRIBUTE_SYSTEM),
+        readonly=bool(attrs & FILE_ATTRIBUTE_READONLY),
+        archive=bool(attrs & FILE_ATTRIBUTE_ARCHIVE),
+        compressed=bool(attrs & FILE_ATTRIBUTE_COMPRESSED),
+        encrypted=bool(attrs & FILE_ATTRIBUTE_ENCRYPTED)
+    )
 
 
-def get_windows_file_attributes(file_path: str) -> Dict[str, bool]:
+def get_windows_file_attributes(file_path: str) -> WinAttrs:
     """
     Retrieve all Windows file attributes for a given file path.
     
@@ -52,59 +168,86 @@ def get_windows_file_attributes(file_path: str) -> Dict[str, bool]:
         file_path: Path to the file to examine
         
     Returns:
-        Dictionary with boolean values for each Windows file attribute
-    """
-    attributes = {
-        'hidden': False,
-        'system': False,
-        'readonly': False,
-        'archive': False,
-        'compressed': False,
-        'encrypted': False
-    }
+        WinAttrs named tuple with boolean values for each Windows file attribute;
+        off Windows readonly, system and archive are estimated from access
+        rights and the path, compressed and encrypted are always False
+    """
+    if not utils.is_windows_os():
+        try:
+            os.stat(file_path)
+        except OSError:
+            return _EMPTY_ATTRS
+        
+        path_lower = file_path.lower()
+        return WinAttrs(
+            hidden=utils.is_hidden_windows_file(file_path),
+            system='system' in path_lower,
+            readonly=not os.access(file_path, os.W_OK),
+            archive=file_path.endswith(('.zip', '.rar')),
+            compressed=False,
+            encrypted=False
+        )
+    
+    attrs = _GetFileAttributesW(file_path)
+    if attrs == INVALID_FILE_ATTRIBUTES:
+        return _EMPTY_ATTRS
+    
+    return windows_attrs_from_flags(attrs)
+
+
+def _is_system_file(file_path: str) -> bool:
+    """
+    Check only the Windows system attribute of a file.
     
-    try:
-        file_stat = os.stat(file_path)
-        
-        attributes['hidden'] = utils.is_hidden_windows_file(file_path)
+    Args:
+        file_path: Path to the file to examine
         
-        try:
-            import ctypes
-            from ctypes import wintypes
-            
-            FILE_ATTRIBUTE_READONLY = 0x1
-            FILE_ATTRIBUTE_HIDDEN = 0x2
-            FILE_ATTRIBUTE_SYSTEM = 0x4
-            FILE_ATTRIBUTE_ARCHIVE = 0x20
-            FILE_ATTRIBUTE_COMPRESSED = 0x800
-            FILE_ATTRIBUTE_ENCRYPTED = 0x4000
-            
-            GetFileAttributes = ctypes.windll.kernel32.GetFileAttributesW
-            GetFileAttributes.argtypes = [wintypes.LPCWSTR]
-            GetFileAttributes.restype = wintypes.DWORD
-            
-            attrs = GetFileAttributes(file_path)
-            
-            if attrs != 0xFFFFFFFF:
-                attributes['readonly'] = bool(attrs & FILE_ATTRIBUTE_READONLY)
-                attributes['system'] = bool(attrs & FILE_ATTRIBUTE_SYSTEM)
-                attributes['archive'] = bool(attrs & FILE_ATTRIBUTE_ARCHIVE)
-                attributes['compressed'] = bool(attrs & FILE_ATTRIBUTE_COMPRESSED)
-                attributes['encrypted'] = bool(attrs & FILE_ATTRIBUTE_ENCRYPTED)
-                
-        except (ImportError, AttributeError, OSError):
-            attributes['readonly'] = not os.access(file_path, os.W_OK)
-            
-            if 'system' in file_path.lower() or file_path.lower().startswith('system'):
-                attributes['system'] = True
-                
-            if file_path.endswith('.zip') or file_path.endswith('.rar'):
-                attributes['archive'] = True
-                
-    except Exception:
-        pass
+    Returns:
+        True if the file has the system attribute, always False off Windows
+    """
+    if not utils.is_windows_os():
+        return False
     
-    return attributes
+    attrs = _GetFileAttributesW(file_path)
+    return attrs != INVALID_FILE_ATTRIBUTES and bool(attrs & FILE_ATTRIBUTE_SYSTEM)
+
+
+def _push_largest(heap: List[Tuple[int, str, str]], limit: int,
+                  file_size: int, entry: os.DirEntry) -> None:
+    """
+    Offer a file to a bounded min-heap holding the largest files seen so far.
+    
+    Args:
+        heap: Min-heap of (size, path, name) tuples
+        limit: Maximum number of files to keep
+        file_size: Size of the offered file in bytes
+        entry: Directory entry of the offered file
+    """
+    if len(heap) < limit:
+        heapq.heappush(heap, (file_size, entry.path, entry.name))
+    elif heap and file_size > heap[0][0]:
+        heapq.heapreplace(heap, (file_size, entry.path, entry.name))
+
+
+def _largest_files_from_heap(heap: List[Tuple[int, str, str]]) -> List[Dict[str, Any]]:
+    """
+    Convert a heap of largest files into result dictionaries sorted by size.
+    
+    Args:
+        heap: Min-heap of (size, path, name) tuples
+        
+    Returns:
+        List of dictionaries containing file information sorted by size
+    """
+    return [
+        {
+            'path': file_path,
+            'name': file_name,
+            'size': file_size,
+            'size_str': utils.format_size(file_size)
+        }
+        for file_size, file_path, file_name in sorted(heap, reverse=True)
+    ]
 
 
 def find_largest_files(path: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -118,28 +261,83 @@ def find_largest_files(path: str, limit: int = 10) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing file information sorted by size
     """
-    largest_files = []
+    if limit <= 0:
+        return []
+    
+    heap = []
     
-    for file_path in safe_file_walk(path):
+    for entry in _iter_file_entries(path):
         try:
-            file_size = os.path.getsize(file_path)
-            file_name = os.path.basename(file_path)
-            
-            largest_files.append({
-                'path': file_path,
-                'name': file_name,
-                'size': file_size,
-                'size_str': utils.format_size(file_size)
-            })
-            
-            largest_files.sort(key=lambda x: x['size'], reverse=True)
-            if len(largest_files) > limit:
-                largest_files = largest_files[:limit]
-                
-        except (OSError, PermissionError):
+            file_size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
             continue
+        
+        _push_largest(heap, limit, file_size, entry)
+    
+    return _largest_files_from_heap(heap)
+
+
+def _hash_file(file_path: str) -> str:
+    """
+    Compute the content checksum of a file.
+    
+    Args:
+        file_path: Path to the file to hash
+        
+    Returns:
+        Hex digest of the file content (BLAKE3, or SHA-256 without blake3)
+    """
+    hasher = _hasher()
+    
+    if hasattr(hasher, 'update_mmap'):
+        hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+    
+    view = getattr(_hash_buffers, 'view', None)
+    if view is None:
+        view = _hash_buffers.view = memoryview(bytearray(_HASH_CHUNK_SIZE))
+    
+    with open(os.open(file_path, _SEQUENTIAL_READ_FLAGS), 'rb', buffering=0) as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        while n := f.readinto(view):
+            hasher.update(view[:n])
+    
+    return hasher.hexdigest()
+
+
+def _hash_file_head(file_path: str) -> str:
+    """
+    Compute the checksum of the first 64 KiB of a file.
     
-    return largest_files
+    Args:
+        file_path: Path to the file to hash
+        
+    Returns:
+        Hex digest of the leading file content
+    """
+    hasher = _hasher()
+    with open(file_path, 'rb') as f:
+        hasher.update(f.read(_HEAD_HASH_SIZE))
+    return hasher.hexdigest()
+
+
+def _try_checksum(checksum_func: Callable, file_path: str):
+    """
+    Apply a checksum function to a file, swallowing read errors.
+    
+    Args:
+        checksum_func: Function mapping a file path to its checksum
+        file_path: Path to the file to hash
+        
+    Returns:
+        Checksum value, or None if the file could not be hashed
+    """
+    try:
+        return checksum_func(file_path)
+    except Exception:
+        return None
 
 
 def find_duplicate_files_recursive(path: str,
@@ -148,9 +346,14 @@ def find_duplicate_files_recursive(path: str,
     """
     Recursively find duplicate files by content checksum comparison.
     
+    Files are first grouped by size, since only files of equal size can be
+    duplicates. Within each group a checksum of the first 64 KiB is used as
+    a cheap discriminator, and only files that still collide are hashed in full.
+    
     Args:
         path: Root directory to search for duplicates
-        checksum_func: Optional custom checksum function, defaults to MD5
+        checksum_func: Optional custom checksum function, defaults to BLAKE3
+                       (SHA-256 when the blake3 package is not installed)
         visited: Set of already processed file paths
         
     Returns:
@@ -159,35 +362,67 @@ def find_duplicate_files_recursive(path: str,
     if visited is None:
         visited = set()
     
-    duplicates = defaultdict(list)
+    by_size = defaultdict(list)
     
-    for file_path in safe_file_walk(path):
-        if file_path in visited:
+    for entry in _iter_file_entries(path):
+        if entry.path in visited:
             continue
         
         try:
-            is_valid, error_msg = utils.validate_windows_path(file_path)
-            if not is_valid:
+            by_size[entry.stat(follow_symlinks=False).st_size].append(entry.path)
+            visited.add(entry.path)
+        except OSError:
+            continue
+    
+    candidates = []
+    
+    for file_size, same_size in by_size.items():
+        if len(same_size) < 2:
+            continue
+        
+        for file_path in same_size:
+            try:
+                is_valid, error_msg = utils.validate_windows_path(file_path)
+                if not is_valid:
+                    continue
+                
+                if _is_system_file(file_path):
+                    continue
+                
+                candidates.append((file_size, file_path))
+                
+            except Exception:
                 continue
-            
-            attrs = get_windows_file_attributes(file_path)
-            if attrs.get('system', False):
+    
+    duplicates = defaultdict(list)
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        by_head = defaultdict(list)
+        head_hashes = executor.map(partial(_try_checksum, _hash_file_head),
+                                   [file_path for _, file_path in candidates])
+        
+        for (file_size, file_path), head_hash in zip(candidates, head_hashes):
+            if head_hash is not None:
+                by_head[(file_size, head_hash)].append(file_path)
+        
+        full_candidates = []
+        
+        for (file_size, head_hash), same_head in by_head.items():
+            if len(same_head) < 2:
                 continue
             
-            if checksum_func:
-                file_hash = checksum_func(file_path)
+            if not checksum_func and file_size <= _HEAD_HASH_SIZE:
+                duplicates[head_hash].extend(same_head)
             else:
-                hasher = hashlib.md5()
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(8192):
-                        hasher.update(chunk)
-                file_hash = hasher.hexdigest()
-            
-            duplicates[file_hash].append(file_path)
-            visited.add(file_path)
-            
-        except Exception:
-            continue
+                full_candidates.extend(same_head)
+        
+        full_hashes = executor.map(partial(_try_checksum, checksum_func or _hash_file),
+                                   full_candidates)
+        
+        for file_path, file_hash in zip(full_candidates, full_hashes):
+            if file_hash is not None:
+                duplicates[file_hash].append(file_path)
     
     return {hash_val: paths for hash_val, paths in duplicates.items() if len(paths) > 1}
 
@@ -214,72 +449,99 @@ def analyze_file_dependencies_recursive(root_path: str,
     
     analyzed = set()
     
-    def find_dependencies(filepath):
+    def find_dependencies(filepath, ext):
         """Extract dependency references from file content."""
         deps = []
         
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            _, ext = os.path.splitext(filepath)
-            
-            patterns = {
-                '.c': r'#include\s+["<]([^">]+)[">]',
-                '.cpp': r'#include\s+["<]([^">]+)[">]',
-                '.h': r'#include\s+["<]([^">]+)[">]',
-                '.hpp': r'#include\s+["<]([^">]+)[">]',
-                '.py': r'^(?:import|from)\s+([a-zA-Z0-9_.]+)',
-                '.js': r'(?:import|require)[^(]+["\']([^"\']+)["\']',
-                '.ts': r'(?:import|require)[^(]+["\']([^"\']+)["\']',
-                '.java': r'^import\s+([a-zA-Z0-9_.]+);'
-            }
-            
-            if ext in patterns:
-                matches = re.findall(patterns[ext], content, re.MULTILINE)
-                deps.extend(matches)
+            pattern = _DEP_PATTERNS.get(ext)
+            if pattern:
+                with open(filepath, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            matches = pattern.findall(mm)
+                        deps.extend(m.decode('utf-8', errors='ignore') for m in matches)
                 
         except Exception:
             pass
         
         return deps
     
-    for file_path in safe_file_walk(root_path):
-        _, ext = os.path.splitext(file_path)
+    target_set = frozenset(ext.lower() for ext in target_extensions)
+    
+    for entry in _iter_file_entries(root_path):
+        _, ext = os.path.splitext(entry.name)
+        ext = ext.lower()
+        if ext not in target_set:
+            continue
+        
+        file_key = os.path.normcase(entry.path)
+        if file_key in analyzed:
+            continue
+        analyzed.add(file_key)
         
-        if ext.lower() in target_extensions and file_path not in analyzed:
-            deps = find_dependencies(file_path)
-            if deps:
-                dependency_tree[file_path] = deps
-            analyzed.add(file_path)
+        deps = find_dependencies(entry.path, ext)
+        if deps:
+            dependency_tree[entry.path] = deps
+    
+    by_name = defaultdict(list)
+    for filepath in dependency_tree:
+        file_name = os.path.basename(filepath)
+        stem, _ = os.path.splitext(file_name)
+        by_name[file_name].append(filepath)
+        if stem and stem != file_name:
+            by_name[stem].append(filepath)
+    
+    def resolve_dependencies(node):
+        """Map the dependency references of a file to known files by name."""
+        module_style = os.path.splitext(node)[1].lower() in ('.py', '.java')
+        
+        for dep in dependency_tree.get(node, ()):
+            name = os.path.basename(dep.replace('\\', '/'))
+            if module_style:
+                name = name.rpartition('.')[2]
+            yield from by_name.get(name, ())
     
     cycles = []
+    seen_cycles = set()
     visited_nodes = set()
     
-    def dfs(node, path):
-        """Depth-first search to detect circular dependencies."""
-        if node in path:
-            cycle_start = path.index(node)
-            cycles.append(path[cycle_start:] + [node])
-            return
-        
-        if node in visited_nodes:
-            return
+    for filepath in dependency_tree:
+        if filepath in visited_nodes:
+            continue
         
-        visited_nodes.add(node)
+        visited_nodes.add(filepath)
+        path = [filepath]
+        on_path = {filepath: 0}
+        stack = [resolve_dependencies(filepath)]
         
-        if node in dependency_tree:
-            for dep in dependency_tree[node]:
-                matching_files = [f for f in dependency_tree.keys() if dep in f]
-                for match in matching_files:
-                    dfs(match, path + [node])
-    
-    for filepath in dependency_tree:
-        dfs(filepath, [])
+        while stack:
+            match = next(stack[-1], None)
+            
+            if match is None:
+                stack.pop()
+                del on_path[path.pop()]
+                continue
+            
+            if match in on_path:
+                cycle = path[on_path[match]:] + [match]
+                cycle_key = frozenset(cycle)
+                if cycle_key not in seen_cycles:
+                    seen_cycles.add(cycle_key)
+                    cycles.append(tuple(cycle))
+                continue
+            
+            if match in visited_nodes:
+                continue
+            
+            visited_nodes.add(match)
+            on_path[match] = len(path)
+            path.append(match)
+            stack.append(resolve_dependencies(match))
     
     return {
         'tree': dependency_tree,
-        'cycles': list(set(tuple(cycle) for cycle in cycles)),
+        'cycles': cycles,
         'files_count': len(dependency_tree),
         'has_cycles': len(cycles) > 0
     }
@@ -294,7 +556,8 @@ def predict_storage_growth_recursive(path: str,
     Args:
         path: Directory to analyze for growth patterns
         days_back: Number of days to consider for historical analysis
-        growth_data: Existing growth data collection to extend
+        growth_data: Existing growth data collection to extend, mapping file
+                     paths to lists of (mtime, size) samples
         
     Returns:
         Dictionary mapping file paths to predicted growth rates in MB per day
@@ -305,22 +568,20 @@ def predict_storage_growth_recursive(path: str,
     cutoff_time = time.time() - (days_back * 24 * 60 * 60)
     current_time = time.time()
     
-    def collect_file_data(file_path):
+    def collect_file_data(entry):
         """Collect file modification timestamp and size data."""
         try:
-            stat_info = os.stat(file_path)
+            stat_info = entry.stat(follow_symlinks=False)
             
             if stat_info.st_mtime >= cutoff_time:
-                growth_data[file_path].append({
-                    'time': stat_info.st_mtime,
-                    'size': stat_info.st_size,
-                    'date': datetime.fromtimestamp(stat_info.st_mtime)
-                })
+                growth_data[entry.path].append((stat_info.st_mtime, stat_info.st_size))
         except Exception:
             pass
     
-    for file_path in safe_file_walk(path):
-        collect_file_data(file_path)
+    for entry in _iter_file_entries(path):
+        collect_file_data(entry)
+    
+    dir_listings = {}
     
     for file_path, data in list(growth_data.items()):
         if len(data) < 3:
@@ -328,6 +589,9 @@ def predict_storage_growth_recursive(path: str,
                 dir_path = os.path.dirname(file_path)
                 file_name = os.path.basename(file_path)
                 
+                if dir_path not in dir_listings:
+                    dir_listings[dir_path] = utils.safe_windows_listdir(dir_path)
+                
                 backup_patterns = [
                     f"{file_name}.bak",
                     f"{file_name}.old",
@@ -337,16 +601,11 @@ def predict_storage_growth_recursive(path: str,
                 ]
                 
                 for pattern in backup_patterns:
-                    import glob
-                    for backup_file in glob.glob(os.path.join(dir_path, pattern)):
+                    for backup_name in fnmatch.filter(dir_listings[dir_path], pattern):
                         try:
-                            backup_stat = os.stat(backup_file)
+                            backup_stat = os.stat(os.path.join(dir_path, backup_name))
                             if backup_stat.st_mtime < cutoff_time:
-                                growth_data[file_path].append({
-                                    'time': backup_stat.st_mtime,
-                                    'size': backup_stat.st_size,
-                                    'date': datetime.fromtimestamp(backup_stat.st_mtime)
-                                })
+                                growth_data[file_path].append((backup_stat.st_mtime, backup_stat.st_size))
                         except:
                             continue
             except:
@@ -355,29 +614,61 @@ def predict_storage_growth_recursive(path: str,
     predictions = {}
     
     for filepath, data in growth_data.items():
-        if len(data) >= 3:
-            data.sort(key=lambda x: x['time'])
-            
-            times = [(d['time'] - data[0]['time']) / (24 * 60 * 60) for d in data]
-            sizes_mb = [d['size'] / (1024 * 1024) for d in data]
-            
-            n = len(times)
-            sum_x = sum(times)
-            sum_y = sum(sizes_mb)
-            sum_xy = sum(x * y for x, y in zip(times, sizes_mb))
-            sum_x2 = sum(x * x for x in times)
-            
-            try:
-                denominator = n * sum_x2 - sum_x * sum_x
-                if denominator != 0:
-                    slope = (n * sum_xy - sum_x * sum_y) / denominator
-                    predictions[filepath] = slope
-            except ZeroDivisionError:
-                continue
+        n = len(data)
+        if n < 3:
+            continue
+        
+        start_time = min(sample_time for sample_time, _ in data)
+        sum_x = sum_y = sum_xy = sum_x2 = 0.0
+        
+        for sample_time, sample_size in data:
+            x = (sample_time - start_time) / (24 * 60 * 60)
+            y = sample_size / (1024 * 1024)
+            sum_x += x
+            sum_y += y
+            sum_xy += x * y
+            sum_x2 += x * x
+        
+        denominator = n * sum_x2 - sum_x * sum_x
+        if denominator != 0:
+            predictions[filepath] = (n * sum_xy - sum_x * sum_y) / denominator
     
     return predictions
 
 
+def _iter_dir_fast(current_path: str, with_size: bool = True):
+    """
+    Iterate the entries of a single directory straight from os.scandir.
+    
+    Args:
+        current_path: Directory to list
+        with_size: Whether to read file sizes (requires a stat on some systems)
+        
+    Yields:
+        Tuples (path, name, is_dir, size); size is 0 for directories or when not requested.
+        Symlinks to directories and dangling links are skipped, so they are neither
+        descended into nor counted as files; links to files report the target size.
+    """
+    try:
+        with os.scandir(current_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_symlink():
+                        if entry.is_dir() or not entry.is_file():
+                            continue
+                        yield entry.path, entry.name, False, entry.stat().st_size if with_size else 0
+                    elif entry.is_dir(follow_symlinks=False):
+                        yield entry.path, entry.name, True, 0
+                    elif with_size:
+                        yield entry.path, entry.name, False, entry.stat(follow_symlinks=False).st_size
+                    else:
+                        yield entry.path, entry.name, False, 0
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
 def count_files(path: str) -> Tuple[bool, int]:
     """
     Recursively count files in a Windows directory.
@@ -390,29 +681,27 @@ def count_files(path: str) -> Tuple[bool, int]:
     """
     total = 0
     
-    def count_recursive(current_path, depth=0):
+    def count_iterative(start_path):
         nonlocal total
+        stack = [(start_path, 0)]
         
-        if depth > 20:
-            return
-        
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
-        
-        for item in items:
-            if item['type'] == 'folder':
-                next_path = os.path.join(current_path, item['name'])
-                count_recursive(next_path, depth + 1)
-            else:
-                total += 1
+        while stack:
+            current_path, depth = stack.pop()
+            if depth > 20:
+                continue
+            
+            for entry_path, _, is_dir, _ in _iter_dir_fast(current_path, with_size=False):
+                if is_dir:
+                    stack.append((entry_path, depth + 1))
+                else:
+                    total += 1
     
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
         if not is_valid:
             return False, 0
         
-        count_recursive(path)
+        count_iterative(path)
         return True, total
     except Exception:
         return False, 0
@@ -430,34 +719,70 @@ def count_bytes(path: str) -> Tuple[bool, int]:
     """
     total_bytes = 0
     
-    def sum_recursive(current_path, depth=0):
+    def sum_iterative(start_path):
         nonlocal total_bytes
+        stack = [(start_path, 0)]
         
-        if depth > 20:
-            return
-        
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
-        
-        for item in items:
-            if item['type'] == 'folder':
-                next_path = os.path.join(current_path, item['name'])
-                sum_recursive(next_path, depth + 1)
-            else:
-                total_bytes += item.get('size', 0)
+        while stack:
+            current_path, depth = stack.pop()
+            if depth > 20:
+                continue
+            
+            for entry_path, _, is_dir, size in _iter_dir_fast(current_path):
+                if is_dir:
+                    stack.append((entry_path, depth + 1))
+                else:
+                    total_bytes += size
     
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
         if not is_valid:
             return False, 0
         
-        sum_recursive(path)
+        sum_iterative(path)
         return True, total_bytes
     except Exception:
         return False, 0
 
 
+def _add_file_type(stats: Dict[str, Dict[str, Any]], file_name: str, file_size: int) -> None:
+    """
+    Account a single file in the per-category file type statistics.
+    
+    Args:
+        stats: Category statistics being accumulated
+        file_name: Name of the file
+        file_size: Size of the file in bytes
+    """
+    _, ext = os.path.splitext(file_name)
+    ext = ext.lower()
+    category = _WINDOWS_FILE_TYPES.get(ext, 'Other')
+    
+    if category not in stats:
+        stats[category] = {'count': 0, 'total_size': 0, 'extensions': set()}
+    
+    stats[category]['count'] += 1
+    stats[category]['total_size'] += file_size
+    stats[category]['extensions'].add(ext)
+
+
+def _finalize_file_types(stats: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Add percentages and average sizes to accumulated file type statistics.
+    
+    Args:
+        stats: Category statistics produced by _add_file_type
+    """
+    total_files = sum(data['count'] for data in stats.values())
+    total_size = sum(data['total_size'] for data in stats.values())
+    
+    for category, data in stats.items():
+        data['percentage'] = (data['count'] / total_files * 100) if total_files > 0 else 0
+        data['size_percentage'] = (data['total_size'] / total_size * 100) if total_size > 0 else 0
+        data['avg_size'] = data['total_size'] / data['count'] if data['count'] > 0 else 0
+        data['extensions'] = list(data['extensions'])
+
+
 def analyze_windows_file_types(path: str) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
     """
     Analyze distribution of Windows-specific file types by extension.
@@ -469,77 +794,28 @@ def analyze_windows_file_types(path: str) -> Tuple[bool, Dict[str, Dict[str, Any
         Tuple containing success status and file type statistics dictionary
     """
     stats = {}
-    windows_extensions = {
-        '.exe': 'Executable file',
-        '.dll': 'Dynamic library',
-        '.msi': 'Installer',
-        '.bat': 'Batch file',
-        '.ps1': 'PowerShell script',
-        '.cmd': 'Command file',
-        '.docx': 'Word document',
-        '.xlsx': 'Excel spreadsheet',
-        '.pptx': 'PowerPoint presentation',
-        '.pdf': 'PDF document',
-        '.txt': 'Text file',
-        '.jpg': 'Image',
-        '.jpeg': 'Image',
-        '.png': 'Image',
-        '.gif': 'Image',
-        '.zip': 'Archive',
-        '.rar': 'Archive',
-        '.7z': 'Archive',
-        '.tar': 'Archive',
-        '.gz': 'Archive',
-        '.log': 'Log file',
-        '.ini': 'Configuration file',
-        '.sys': 'System file',
-        '.tmp': 'Temporary file'
-    }
     
-    def analyze_recursive(current_path, depth=0):
-        if depth > 20:
-            return
+    def analyze_iterative(start_path):
+        stack = [(start_path, 0)]
         
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
-        
-        for item in items:
-            if item['type'] == 'folder':
-                next_path = os.path.join(current_path, item['name'])
-                analyze_recursive(next_path, depth + 1)
-            else:
-                _, ext = os.path.splitext(item['name'])
-                ext = ext.lower()
-                
-                if ext in windows_extensions:
-                    category = windows_extensions[ext]
+        while stack:
+            current_path, depth = stack.pop()
+            if depth > 20:
+                continue
+            
+            for entry_path, name, is_dir, size in _iter_dir_fast(current_path):
+                if is_dir:
+                    stack.append((entry_path, depth + 1))
                 else:
-                    category = 'Other'
-                
-                if category not in stats:
-                    stats[category] = {'count': 0, 'total_size': 0, 'extensions': set()}
-                
-                stats[category]['count'] += 1
-                stats[category]['total_size'] += item.get('size', 0)
-                stats[category]['extensions'].add(ext)
+                    _add_file_type(stats, name, size)
     
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
         if not is_valid:
             return False, {}
         
-        analyze_recursive(path)
-        
-        if stats:
-            total_files = sum(data['count'] for data in stats.values())
-            total_size = sum(data['total_size'] for data in stats.values())
-            
-            for category, data in stats.items():
-                data['percentage'] = (data['count'] / total_files * 100) if total_files > 0 else 0
-                data['size_percentage'] = (data['total_size'] / total_size * 100) if total_size > 0 else 0
-                data['avg_size'] = data['total_size'] / data['count'] if data['count'] > 0 else 0
-                data['extensions'] = list(data['extensions'])
+        analyze_iterative(path)
+        _finalize_file_types(stats)
         
         return True, stats
     except Exception:
@@ -556,44 +832,79 @@ def get_windows_file_attributes_stats(path: str) -> Dict[str, int]:
     Returns:
         Dictionary with counts for each Windows file attribute type
     """
-    stats = {
-        'hidden': 0,
-        'system': 0,
-        'readonly': 0,
-        'archive': 0,
-        'compressed': 0,
-        'encrypted': 0
-    }
+    counts = [0] * len(WinAttrs._fields)
     
-    def check_recursive(current_path, depth=0):
-        if depth > 20:
-            return
-        
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+    def check_iterative(start_path):
+        stack = [(start_path, 0)]
         
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
+        while stack:
+            current_path, depth = stack.pop()
+            if depth > 20:
+                continue
             
-            if item['type'] == 'folder':
-                check_recursive(item_path, depth + 1)
-            else:
-                attrs = get_windows_file_attributes(item_path)
-                
-                for attr_name, attr_value in attrs.items():
-                    if attr_value:
-                        stats[attr_name] += 1
+            for entry_path, _, is_dir, _ in _iter_dir_fast(current_path, with_size=False):
+                if is_dir:
+                    stack.append((entry_path, depth + 1))
+                else:
+                    attrs = get_windows_file_attributes(entry_path)
+                    
+                    for index, attr_value in enumerate(attrs):
+                        if attr_value:
+                            counts[index] += 1
     
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
-        if not is_valid:
-            return stats
-        
-        check_recursive(path)
-        return stats
+        if is_valid:
+            check_iterative(path)
     except Exception:
-        return stats
+        pass
+    
+    return dict(zip(WinAttrs._fields, counts))
+
+
+def _walk_and_aggregate(path: str, largest_limit: int = 10) -> Dict[str, Any]:
+    """
+    Collect all directory statistics in a single traversal.
+    
+    Args:
+        path: Directory to analyze
+        largest_limit: Number of largest files to keep
+        
+    Returns:
+        Dictionary with file count, total size, file type statistics,
+        attribute counts and the largest files
+    """
+    file_count = 0
+    total_bytes = 0
+    type_stats = {}
+    attr_counts = [0] * len(WinAttrs._fields)
+    heap = []
+    
+    for entry in _iter_file_entries(path, max_depth=20):
+        try:
+            file_size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        
+        file_count += 1
+        total_bytes += file_size
+        _add_file_type(type_stats, entry.name, file_size)
+        
+        for index, attr_value in enumerate(get_windows_file_attributes(entry.path)):
+            if attr_value:
+                attr_counts[index] += 1
+        
+        _push_largest(heap, largest_limit, file_size, entry)
+    
+    _finalize_file_types(type_stats)
+    
+    return {
+        'file_count': file_count,
+        'total_bytes': total_bytes,
+        'type_stats': type_stats,
+        'attr_stats': dict(zip(WinAttrs._fields, attr_counts)),
+        'largest_files': _largest_files_from_heap(heap)
+    }
 
 
 def show_windows_directory_stats(path: str) -> bool:
@@ -616,19 +927,17 @@ def show_windows_directory_stats(path: str) -> bool:
             print(ru.PATH_ERROR.format(error=error_msg))
             return False
         
+        summary = _walk_and_aggregate(path, largest_limit=5)
+        
         print(f"\n{ru.GENERAL_INFO}")
-        success, file_count = count_files(path)
-        if success:
-            print(f"   {ru.FILES_COUNT.format(count=file_count)}")
+        print(f"   {ru.FILES_COUNT.format(count=summary['file_count'])}")
         
-        success, total_bytes = count_bytes(path)
-        if success:
-            size_str = utils.format_size(total_bytes)
-            print(f"   {ru.TOTAL_SIZE.format(size=size_str)}")
+        size_str = utils.format_size(summary['total_bytes'])
+        print(f"   {ru.TOTAL_SIZE.format(size=size_str)}")
         
         print(f"\n{ru.FILE_TYPES}")
-        success, type_stats = analyze_windows_file_types(path)
-        if success and type_stats:
+        type_stats = summary['type_stats']
+        if type_stats:
             sorted_stats = sorted(type_stats.items(), key=lambda x: x[1]['count'], reverse=True)
             
             for category, data in sorted_stats[:10]:
@@ -644,13 +953,12 @@ def show_windows_directory_stats(path: str) -> bool:
                     print(f"     Расширения: {extensions_str}")
         
         print(f"\n{ru.FILE_ATTRIBUTES}")
-        attr_stats = get_windows_file_attributes_stats(path)
-        for attr, count in attr_stats.items():
+        for attr, count in summary['attr_stats'].items():
             if count > 0:
                 print(f"   {attr}: {count}")
         
         print(f"\n{ru.LARGEST_FILES}")
-        largest_files = find_largest_files(path, limit=5)
+        largest_files = summary['largest_files']
         if largest_files:
             for i, file_info in enumerate(largest_files, 1):
                 display_path = file_info['path']
@@ -30,23 +30,24 @@ def display_windows_banner() -> None:
     Displays a welcome banner with Windows-specific information.
     Shows current drive, path, available drives, and basic instructions.
     """
-    print("=" * 70)
-    print(ru.TITLE.center(70))
-    print("=" * 70)
-    print(ru.YEAR_2142.center(70))
-    print("=" * 70)
-    
     current_drive = navigation.get_current_drive()
-    print(ru.CURRENT_DRIVE.format(drive=current_drive))
-    
     current_path = os.getcwd()
-    print(ru.CURRENT_PATH.format(path=current_path))
-    
     drives = navigation.list_available_drives()
-    print(ru.AVAILABLE_DRIVES.format(drives=', '.join(drives)))
     
-    print("\n" + ru.HELP_COMMAND)
-    print("=" * 70)
+    lines = [
+        "=" * 70,
+        ru.TITLE.center(70),
+        "=" * 70,
+        ru.YEAR_2142.center(70),
+        "=" * 70,
+        ru.CURRENT_DRIVE.format(drive=current_drive),
+        ru.CURRENT_PATH.format(path=current_path),
+        ru.AVAILABLE_DRIVES.format(drives=', '.join(drives)),
+        "\n" + ru.HELP_COMMAND,
+        "=" * 70
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def display_main_menu(current_path: str) -> None:
@@ -55,21 +56,8 @@ def display_main_menu(current_path: str) -> None:
     Args:
         current_path: Current working directory path.
     """
-    print(f"\n{ru.CURRENT_PATH.format(path=current_path)}")
-    print("-" * 70)
-    
-    print(ru.MAIN_MENU_TITLE)
-    print(f"  {ru.LIST_CONTENTS}")
-    print(f"  {ru.ANALYZE_DIR}")
-    print(f"  {ru.SEARCH_FILES}")
-    print(f"  {ru.ADVANCED_ANALYSIS}")
-    print(f"  {ru.MOVE_UP}")
-    print(f"  {ru.MOVE_DOWN}")
-    print(f"  {ru.SPECIAL_FOLDERS}")
-    print(f"  {ru.CHANGE_DRIVE}")
-    print(f"  {ru.EXIT_PROGRAM}")
-    print(f"  {ru.HELP_MENU}")
-    print("-" * 70)
+    sys.stdout.write(f"\n{ru.CURRENT_PATH.format(path=current_path)}\n{_MENU_BODY}\n")
+    sys.stdout.flush()
 
 
 def handle_windows_navigation(command: str, current_path: str) -> str:
@@ -153,6 +141,7 @@ def handle_windows_navigation(command: str, current_path: str) -> str:
         if selected_drive in drives:
             new_path = selected_drive + "\\"
             if os.path.exists(new_path):
+                navigation.invalidate_drive_caches()
                 print(ru.SWITCHED_DRIVE.format(drive=selected_drive))
                 return new_path
             print(ru.DRIVE_UNAVAILABLE.format(drive=selected_drive))
@@ -254,65 +243,126 @@ def handle_windows_search(command: str, current_path: str) -> None:
             print(ru.RETURN_MAIN_MENU)
 
 
+def _cmd_list(command: str, current_path: str) -> str:
+    """
+    Shows the contents of the current directory.
+    """
+    print(f"\n{ru.DIRECTORY_CONTENTS.format(path=current_path)}")
+    success, items = navigation.list_directory(current_path)
+    if success:
+        navigation.format_directory_output(items)
+        print(f"\n{ru.TOTAL_ITEMS.format(count=len(items))}")
+    else:
+        print(ru.FAILED_LIST_DIR)
+    return current_path
+
+
+def _cmd_analysis(command: str, current_path: str) -> str:
+    """
+    Runs basic or advanced analysis of the current directory.
+    """
+    handle_windows_analysis(command, current_path)
+    return current_path
+
+
+def _cmd_search(command: str, current_path: str) -> str:
+    """
+    Opens the search menu for the current directory.
+    """
+    handle_windows_search(command, current_path)
+    return current_path
+
+
+def _cmd_exit(command: str, current_path: str) -> NoReturn:
+    """
+    Exits the program.
+    """
+    print(f"\n{ru.EXIT_PROGRAM_CONFIRM}")
+    print(ru.THANK_YOU)
+    sys.exit(0)
+
+
+def _cmd_help(command: str, current_path: str) -> str:
+    """
+    Shows the command reference.
+    """
+    print(_HELP_TEXT)
+    return current_path
+
+
+def _cmd_empty(command: str, current_path: str) -> str:
+    """
+    Ignores an empty command.
+    """
+    return current_path
+
+
+def _cmd_unknown(command: str, current_path: str) -> str:
+    """
+    Reports an unknown command.
+    """
+    print(ru.UNKNOWN_COMMAND.format(command=command))
+    print(f"   {ru.ENTER_HELP}")
+    return current_path
+
+
+_MENU_BODY = "\n".join([
+    "-" * 70,
+    ru.MAIN_MENU_TITLE,
+    f"  {ru.LIST_CONTENTS}",
+    f"  {ru.ANALYZE_DIR}",
+    f"  {ru.SEARCH_FILES}",
+    f"  {ru.ADVANCED_ANALYSIS}",
+    f"  {ru.MOVE_UP}",
+    f"  {ru.MOVE_DOWN}",
+    f"  {ru.SPECIAL_FOLDERS}",
+    f"  {ru.CHANGE_DRIVE}",
+    f"  {ru.EXIT_PROGRAM}",
+    f"  {ru.HELP_MENU}",
+    "-" * 70
+])
+
+_HELP_TEXT = "\n".join([
+    "\n" + "=" * 70,
+    ru.HELP_TITLE.center(70),
+    "=" * 70,
+    ru.SHOW_CONTENTS,
+    ru.BASIC_STATISTICS,
+    ru.SEARCH_MENU_HELP,
+    ru.ADVANCED_STATISTICS,
+    ru.GO_PARENT,
+    ru.GO_SUBDIR,
+    ru.SPECIAL_FOLDERS_HELP,
+    ru.CHANGE_DRIVE_HELP,
+    ru.EXIT_HELP,
+    "=" * 70
+])
+
+_HANDLERS = {
+    "1": _cmd_list,
+    "2": _cmd_analysis,
+    "4": _cmd_analysis,
+    "3": _cmd_search,
+    "5": handle_windows_navigation,
+    "6": handle_windows_navigation,
+    "7": handle_windows_navigation,
+    "8": handle_windows_navigation,
+    "0": _cmd_exit,
+    "help": _cmd_help,
+    "": _cmd_empty
+}
+
+
 def run_windows_command(command: str, current_path: str) -> str:
     """
-    Main command handler using match-case.
+    Main command handler using a dispatch table.
     Args:
         command: User command input.
         current_path: Current working directory path.
     Returns:
         str: New path after command execution.
     """
-    match command:
-        case "1":
-            print(f"\n{ru.DIRECTORY_CONTENTS.format(path=current_path)}")
-            success, items = navigation.list_directory(current_path)
-            if success:
-                navigation.format_directory_output(items)
-                print(f"\n{ru.TOTAL_ITEMS.format(count=len(items))}")
-            else:
-                print(ru.FAILED_LIST_DIR)
-            return current_path
-            
-        case "2" | "4":
-            handle_windows_analysis(command, current_path)
-            return current_path
-            
-        case "3":
-            handle_windows_search(command, current_path)
-            return current_path
-            
-        case "5" | "6" | "7" | "8":
-            return handle_windows_navigation(command, current_path)
-            
-        case "0":
-            print(f"\n{ru.EXIT_PROGRAM_CONFIRM}")
-            print(ru.THANK_YOU)
-            sys.exit(0)
-            
-        case "help":
-            print("\n" + "=" * 70)
-            print(ru.HELP_TITLE.center(70))
-            print("=" * 70)
-            print(ru.SHOW_CONTENTS)
-            print(ru.BASIC_STATISTICS)
-            print(ru.SEARCH_MENU_HELP)
-            print(ru.ADVANCED_STATISTICS)
-            print(ru.GO_PARENT)
-            print(ru.GO_SUBDIR)
-            print(ru.SPECIAL_FOLDERS_HELP)
-            print(ru.CHANGE_DRIVE_HELP)
-            print(ru.EXIT_HELP)
-            print("=" * 70)
-            return current_path
-            
-        case "":
-            return current_path
-            
-        case _:
-            print(ru.UNKNOWN_COMMAND.format(command=command))
-            print(f"   {ru.ENTER_HELP}")
-            return current_path
+    return _HANDLERS.get(command, _cmd_unknown)(command, current_path)
 
 
 def main() -> NoReturn:
@@ -1,10 +1,35 @@
 # navigation.py
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Tuple, Generator, Optional
+import json
+import re
+import fnmatch
+import stat
+import sys
+import time
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Generator, Optional, Union
 import utils
 import ru_local as ru
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_CACHE_TTL = 5.0
+_WRITE_BUFFER_SIZE = 1 << 20
+_WRITE_CHUNK_ROWS = 8192
+_SYSTEM_KEYWORDS = ('Windows', 'Program Files', 'ProgramData', '$', 'System Volume Information')
+_drives_cache: Optional[Tuple[float, List[str]]] = None
+_special_cache: Optional[Dict[str, str]] = None
+
+_LISTING_CACHE_SIZE = 64
+_LISTING_CACHE_TTL = 10.0
+_listing_cache = OrderedDict()
+_listing_lock = threading.Lock()
+
 
 def get_current_drive() -> str:
     """
@@ -22,12 +47,25 @@ def list_available_drives() -> List[str]:
     Returns:
         List[str]: List of available drives (['C:', 'D:', ...])
     """
-    drives = []
-    for letter in range(ord('A'), ord('Z') + 1):
-        drive_letter = chr(letter) + ":"
-        if os.path.exists(drive_letter + "\\"):
-            drives.append(drive_letter)
-    return drives
+    global _drives_cache
+
+    now = time.monotonic()
+    if _drives_cache is not None and now - _drives_cache[0] < _CACHE_TTL:
+        return list(_drives_cache[1])
+
+    drives = utils.get_logical_drives()
+
+    _drives_cache = (now, drives)
+    return list(drives)
+
+
+def invalidate_drive_caches() -> None:
+    """
+    Drop cached drive and special folder lookups so the next call re-probes them.
+    """
+    global _drives_cache, _special_cache
+    _drives_cache = None
+    _special_cache = None
 
 
 def list_directory(path: str) -> Tuple[bool, List[Dict[str, Any]]]:
@@ -46,34 +84,53 @@ def list_directory(path: str) -> Tuple[bool, List[Dict[str, Any]]]:
     if not is_valid:
         return False, []
 
-    items = utils.safe_windows_listdir(path)
+    try:
+        dir_mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+
+    cache_key = (path, dir_mtime)
+    now = time.monotonic()
+
+    with _listing_lock:
+        cached = _listing_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _LISTING_CACHE_TTL:
+            _listing_cache.move_to_end(cache_key)
+            return True, list(cached[1])
+
     result = []
 
-    for item_name in items:
-        item_path = os.path.join(path, item_name)
+    try:
+        for item_name, attributes, size, modified_timestamp in utils.iter_windows_find_data(path):
+            try:
+                is_file = not attributes & stat.FILE_ATTRIBUTE_DIRECTORY
 
-        try:
-            stat_info = os.stat(item_path)
-            is_file = os.path.isfile(item_path)
+                modified_time = time.localtime(modified_timestamp)
+                modified_str = f"{modified_time.tm_year:04d}-{modified_time.tm_mon:02d}-{modified_time.tm_mday:02d}"
 
-            modified_timestamp = stat_info.st_mtime
-            modified_date = datetime.fromtimestamp(modified_timestamp)
-            modified_str = modified_date.strftime("%Y-%m-%d")
+                item_info = {
+                    'name': item_name,
+                    'type': 'file' if is_file else 'folder',
+                    'size': size if is_file else 0,
+                    'modified': modified_str,
+                    'hidden': bool(attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+                }
 
-            item_info = {
-                'name': item_name,
-                'type': 'file' if is_file else 'folder',
-                'size': stat_info.st_size if is_file else 0,
-                'modified': modified_str,
-                'hidden': utils.is_hidden_windows_file(item_path)
-            }
+                result.append(item_info)
 
-            result.append(item_info)
+            except (PermissionError, OSError):
+                continue
+    except (PermissionError, FileNotFoundError, OSError):
+        pass
 
-        except (PermissionError, OSError):
-            continue
+    if dir_mtime is not None:
+        with _listing_lock:
+            _listing_cache[cache_key] = (now, result)
+            _listing_cache.move_to_end(cache_key)
+            while len(_listing_cache) > _LISTING_CACHE_SIZE:
+                _listing_cache.popitem(last=False)
 
-    return True, result
+    return True, list(result)
 
 
 def format_directory_output(items: List[Dict[str, Any]]) -> None:
@@ -87,8 +144,10 @@ def format_directory_output(items: List[Dict[str, Any]]) -> None:
         print(ru.EMPTY_DIRECTORY)
         return
 
-    print(f"{ru.TYPE:<10} {ru.SIZE:<12} {ru.MODIFIED:<12} {ru.HIDDEN:<8} {ru.NAME:<30}")
-    print("-" * 80)
+    lines = [
+        f"{ru.TYPE:<10} {ru.SIZE:<12} {ru.MODIFIED:<12} {ru.HIDDEN:<8} {ru.NAME:<30}",
+        "-" * 80
+    ]
 
     for item in items:
         if item['type'] == 'file':
@@ -101,7 +160,10 @@ def format_directory_output(items: List[Dict[str, Any]]) -> None:
         if len(name) > 28:
             name = name[:25] + "..."
 
-        print(f"{item['type']:<10} {size_str:<12} {item['modified']:<12} {hidden_str:<8} {name:<30}")
+        lines.append(f"{item['type']:<10} {size_str:<12} {item['modified']:<12} {hidden_str:<8} {name:<30}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def move_up(current_path: str) -> str:
@@ -135,29 +197,37 @@ def move_down(current_path: str, target_dir: str) -> Tuple[bool, str]:
             - First element: True on success, False on error
             - Second element: New path on success, current path on error
     """
-    new_path = os.path.join(current_path, target_dir)
-    items = utils.safe_windows_listdir(current_path)
-
-    if target_dir not in items:
+    if target_dir in ("", ".", "..") or os.path.basename(target_dir) != target_dir:
         return False, current_path
 
-    if not os.path.isdir(new_path):
-        return False, current_path
+    new_path = os.path.join(current_path, target_dir)
 
     is_valid, error_msg = utils.validate_windows_path(new_path)
     if not is_valid:
         return False, current_path
 
+    try:
+        with os.scandir(new_path):
+            pass
+    except OSError:
+        return False, current_path
+
     return True, new_path
 
 
 def get_windows_special_folders() -> Dict[str, str]:
     """
     Get paths to Windows special folders.
+    Resolved once per session; invalidate_drive_caches forces a refresh.
 
     Returns:
         Dict[str, str]: Dictionary with paths to special folders
     """
+    global _special_cache
+
+    if _special_cache is not None:
+        return dict(_special_cache)
+
     special_folders = {}
     user_profile = os.environ.get('USERPROFILE', '')
 
@@ -193,16 +263,17 @@ def get_windows_special_folders() -> Dict[str, str]:
         if os.path.exists(path):
             special_folders[name] = path
 
-    return special_folders
+    _special_cache = special_folders
+    return dict(special_folders)
 
 
+@lru_cache(maxsize=4096)
 def is_windows_system_path(path: str) -> bool:
     """
     Check if path is a Windows system directory.
     """
-    system_keywords = ['Windows', 'Program Files', 'ProgramData', '$', 'System Volume Information']
     path_normalized = os.path.normpath(path)
-    for keyword in system_keywords:
+    for keyword in _SYSTEM_KEYWORDS:
         if keyword in path_normalized:
             return True
     return False
@@ -215,14 +286,56 @@ def normalize_windows_path(path: str) -> str:
     return os.path.normpath(path)
 
 
+def get_windows_attrs(path_or_entry: Union[str, os.DirEntry]) -> int:
+    """
+    Read the raw Windows attribute mask of a file with a single stat.
+    Scandir entries reuse the data cached during directory enumeration.
+
+    Args:
+        path_or_entry: File path or os.scandir entry
+
+    Returns:
+        int: FILE_ATTRIBUTE_* bit mask, 0 if unavailable
+    """
+    try:
+        if isinstance(path_or_entry, os.DirEntry):
+            stat_info = path_or_entry.stat(follow_symlinks=False)
+        else:
+            stat_info = os.stat(path_or_entry, follow_symlinks=False)
+    except OSError:
+        return 0
+    return getattr(stat_info, 'st_file_attributes', 0)
+
+
+def _scan_tree(path: str, max_depth: int) -> Dict[str, List[os.DirEntry]]:
+    """
+    Read directory listings breadth-first with utils.walk_directory_levels.
+    System directories and directory symlinks are not descended into.
+
+    Args:
+        path: Root directory
+        max_depth: Number of levels below the root to read
+
+    Returns:
+        Dictionary mapping each read directory path to its entries
+    """
+    def descend(entry: os.DirEntry, depth: int) -> bool:
+        return not is_windows_system_path(entry.path)
+
+    return {
+        dir_path: entries
+        for dir_path, entries, _ in utils.walk_directory_levels(path, max_depth, descend)
+    }
+
+
 def build_windows_tree_recursive(path: str, depth: int = 0, max_depth: int = 5) -> Dict[str, Any]:
     """
-    Recursive Windows directory tree building with visualization
+    Windows directory tree building with visualization
     
     Args:
         path: Path to analyze
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth
+        depth: Depth of the starting path
+        max_depth: Maximum tree depth
     
     Returns:
         Dictionary with directory tree structure
@@ -241,90 +354,98 @@ def build_windows_tree_recursive(path: str, depth: int = 0, max_depth: int = 5)
             "children": []
         }
 
-    try:
-        items = utils.safe_windows_listdir(path)
-        children = []
-
-        for item_name in items:
-            item_path = os.path.join(path, item_name)
-            
-            try:
-                if os.path.isdir(item_path):
-                    if is_windows_system_path(item_path):
-                        child_tree = {
-                            "name": item_name,
-                            "type": "system_directory",
-                            "children": []
-                        }
-                    else:
-                        child_tree = build_windows_tree_recursive(item_path, depth + 1, max_depth)
-                    children.append(child_tree)
-                else:
-                    file_info = {
-                        "name": item_name,
-                        "type": "file",
-                        "hidden": utils.is_hidden_windows_file(item_path)
-                    }
-                    children.append(file_info)
-            except:
-                continue
-
-        return {
-            "name": os.path.basename(path),
-            "type": "directory",
-            "children": children
-        }
+    tree = {
+        "name": os.path.basename(path),
+        "type": "directory",
+        "children": []
+    }
+    listings = _scan_tree(path, max_depth - depth - 1)
+    stack = [(path, depth, tree["children"])]
+
+    while stack:
+        current_path, current_depth, children = stack.pop()
+
+        for entry in listings.get(current_path, []):
+            if utils.entry_is_dir(entry):
+                if is_windows_system_path(entry.path):
+                    children.append({
+                        "name": entry.name,
+                        "type": "system_directory",
+                        "children": []
+                    })
+                    continue
+
+                child_tree = {
+                    "name": entry.name,
+                    "type": "directory",
+                    "children": []
+                }
+                children.append(child_tree)
+
+                if current_depth + 1 < max_depth:
+                    stack.append((entry.path, current_depth + 1, child_tree["children"]))
+            else:
+                children.append({
+                    "name": entry.name,
+                    "type": "file",
+                    "hidden": bool(get_windows_attrs(entry) & stat.FILE_ATTRIBUTE_HIDDEN)
+                })
 
-    except Exception:
-        return {
-            "name": os.path.basename(path),
-            "type": "directory",
-            "children": []
-        }
+    return tree
 
 
 def recursive_path_explorer(start_path: str, history: Optional[List[str]] = None) -> Generator[Tuple[str, List[str]], None, None]:
     """
-    Recursive generator for navigation with visit history tracking
+    Depth-first generator for navigation with visit history tracking
     
     Args:
         start_path: Starting path
         history: List of visited paths
     
     Yields:
-        Tuple: (current_path, visit_history)
+        Tuple: (current_path, visit_history). The history list is reused
+        between steps; copy it to keep a snapshot.
     """
     if history is None:
         history = []
 
-    history.append(start_path)
-    yield start_path, history.copy()
+    base = len(history)
+    stack = [(start_path, 0)]
 
-    try:
-        success, items = list_directory(start_path)
-        if not success:
-            return
-
-        for item in items:
-            if item['type'] == 'folder':
-                next_path = os.path.join(start_path, item['name'])
-                if not is_windows_system_path(next_path):
-                    yield from recursive_path_explorer(next_path, history.copy())
-    except Exception:
-        pass
+    while stack:
+        current_path, depth = stack.pop()
+        del history[base + depth:]
+        history.append(current_path)
+        yield current_path, history
+
+        is_valid, error_msg = utils.validate_windows_path(current_path)
+        if not is_valid:
+            continue
+
+        next_paths = []
+        try:
+            with os.scandir(current_path) as it:
+                for entry in it:
+                    if utils.entry_is_dir(entry) and not is_windows_system_path(entry.path):
+                        next_paths.append(entry.path)
+        except OSError:
+            continue
+
+        for next_path in reversed(next_paths):
+            stack.append((next_path, depth + 1))
 
 
 def analyze_windows_structure_recursive(path: str, pattern: str = "*", level: int = 0) -> List[Tuple[int, str, str]]:
     """
-    Recursive directory structure analysis with pattern search
+    Directory structure analysis with pattern search
 
     Args:
         path: Path to analyze
         pattern: Search pattern (e.g., "*.exe")
-        level: Current nesting level
+        level: Nesting level of the starting path
 
     Returns:
-        List of tuples: (level, type, path)
+        List of tuples: (level, type, path) in depth-first order
     """
     result = []
     max_level = 10
@@ -332,39 +453,47 @@ def analyze_windows_structure_recursive(path: str, pattern: str = "*", level: in
     if level > max_level:
         return result
 
-    try:
-        items = utils.safe_windows_listdir(path)
+    name_match = None
+    if pattern != "*":
+        name_match = re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
 
-        for item_name in items:
-            item_path = os.path.join(path, item_name)
+    root = normalize_windows_path(path)
+    children_normalized = root != os.curdir
 
-            if not os.path.exists(item_path):
-                continue
+    listings = _scan_tree(root, max_level - level)
+    stack = [(iter(listings.get(root, [])), level)]
 
-            if os.path.isdir(item_path):
-                elem_type = "DIR"
-                if is_windows_system_path(item_path):
-                    elem_type = "SYS_DIR"
-                elif utils.is_hidden_windows_file(item_path):
-                    elem_type = "HID_DIR"
-            else:
-                elem_type = "FILE"
-                if utils.is_hidden_windows_file(item_path):
-                    elem_type = "HID_FILE"
+    while stack:
+        entries, current_level = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+
+        is_dir = utils.entry_is_dir(entry)
 
-                if pattern != "*":
-                    if not item_name.lower().endswith(pattern.replace("*", "").lower()):
-                        continue
+        if is_dir:
+            elem_type = "DIR"
+            if is_windows_system_path(entry.path):
+                elem_type = "SYS_DIR"
+            elif get_windows_attrs(entry) & stat.FILE_ATTRIBUTE_HIDDEN:
+                elem_type = "HID_DIR"
+        else:
+            if entry.is_symlink() and not utils.entry_is_file(entry) and not os.path.exists(entry.path):
+                continue
+
+            elem_type = "FILE"
+            if get_windows_attrs(entry) & stat.FILE_ATTRIBUTE_HIDDEN:
+                elem_type = "HID_FILE"
 
-            result.append((level, elem_type, normalize_windows_path(item_path)))
+            if name_match is not None and not name_match(entry.name):
+                continue
 
-            if os.path.isdir(item_path) and elem_type not in ["SYS_DIR"]:
-                if not is_windows_system_path(item_path):
-                    sub_result = analyze_windows_structure_recursive(item_path, pattern, level + 1)
-                    result.extend(sub_result)
+        entry_path = entry.path if children_normalized else normalize_windows_path(entry.path)
+        result.append((current_level, elem_type, entry_path))
 
-    except Exception:
-        result.append((level, "ERROR", path))
+        if is_dir and elem_type != "SYS_DIR" and current_level < max_level:
+            stack.append((iter(listings.get(entry.path, [])), current_level + 1))
 
     return result
 
@@ -380,27 +509,29 @@ def print_analysis_results(analysis_results: List[Tuple[int, str, str]]) -> None
         print(ru.NO_DATA)
         return
 
-    print(f"\n{ru.DIRECTORY_ANALYSIS}")
-    print(ru.TOTAL_ELEMENTS.format(count=len(analysis_results)))
-    print("-" * 80)
-    print(f"{ru.LEVEL:<4} {ru.TYPE_COL:<10} {ru.PATH_COL}")
-    print("-" * 80)
+    lines = [
+        f"\n{ru.DIRECTORY_ANALYSIS}",
+        ru.TOTAL_ELEMENTS.format(count=len(analysis_results)),
+        "-" * 80,
+        f"{ru.LEVEL:<4} {ru.TYPE_COL:<10} {ru.PATH_COL}",
+        "-" * 80
+    ]
     
-    type_stats = {}
+    type_stats = Counter(elem_type for _, elem_type, _ in analysis_results)
     
-    for level, elem_type, path in analysis_results:
-        type_stats[elem_type] = type_stats.get(elem_type, 0) + 1
-        indent = "  " * level
-        
-        if len(path) > 70:
-            path = path[:35] + "..." + path[-32:]
-        
-        print(f"{level:<4} {elem_type:<10} {indent}{path}")
+    lines.extend(
+        f"{level:<4} {elem_type:<10} {'  ' * level}{path if len(path) <= 70 else path[:35] + '...' + path[-32:]}"
+        for level, elem_type, path in analysis_results
+    )
     
-    print(f"\n{ru.STATISTICS}")
+    lines.append(f"\n{ru.STATISTICS}")
+    total = len(analysis_results)
     for elem_type, count in sorted(type_stats.items()):
-        percentage = (count / len(analysis_results)) * 100
-        print(f"{elem_type:<10}: {count:>4} ({percentage:>5.1f}%)")
+        percentage = (count / total) * 100
+        lines.append(f"{elem_type:<10}: {count:>4} ({percentage:>5.1f}%)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def navigate_with_history(start_path: str) -> None:
@@ -442,9 +573,12 @@ def export_tree_to_json(tree: Dict[str, Any], filename: str) -> bool:
         True if successful, False on error
     """
     try:
-        import json
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(tree, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(tree, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(tree, f, ensure_ascii=False, indent=2)
         print(ru.TREE_EXPORTED.format(filename=filename))
         return True
     except Exception as e:
@@ -464,10 +598,11 @@ def save_analysis_to_file(analysis_results: List[Tuple[int, str, str]], filename
         True if successful, False on error
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE, newline='') as f:
             f.write("Уровень;Тип;Путь\n")
-            for level, elem_type, path in analysis_results:
-                f.write(f"{level};{elem_type};{path}\n")
+            for start in range(0, len(analysis_results), _WRITE_CHUNK_ROWS):
+                chunk = analysis_results[start:start + _WRITE_CHUNK_ROWS]
+                f.write("".join(f"{level};{elem_type};{path}\n" for level, elem_type, path in chunk))
         print(ru.ANALYSIS_SAVED.format(filename=filename))
         return True
     except Exception as e:
@@ -479,19 +614,11 @@ def is_readonly_windows_file(path: str) -> bool:
     """
     Check if file is read-only in Windows
     """
-    try:
-        return not os.access(path, os.W_OK)
-    except:
-        return False
+    return bool(get_windows_attrs(path) & stat.FILE_ATTRIBUTE_READONLY)
 
 
 def is_system_windows_file(path: str) -> bool:
     """
     Check if file has system attribute in Windows
     """
-    try:
-        import ctypes
-        attributes = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-        return attributes != -1 and (attributes & 4)
-    except:
-        return False
\ No newline at end of file
+    return bool(get_windows_attrs(path) & stat.FILE_ATTRIBUTE_SYSTEM)
@@ -2,10 +2,14 @@
 import os
 import re
 import fnmatch
+import heapq
+import mmap
+import stat
 import time
 import datetime
-from typing import List, Dict, Any, Tuple, Optional, Generator
-from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Optional, Callable, MutableMapping
+from collections import Counter, OrderedDict, defaultdict
 
 import utils
 import navigation
@@ -13,6 +17,146 @@ import analysis
 import ru_local as ru
 
 
+_PROGRESS_EVERY = 1000
+_MMAP_MIN_SIZE = 1 << 20
+_MAX_CONTENT_FILE_SIZE = 256 << 20
+_SNIFF_SIZE = 4096
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.sys', '.so', '.o', '.a', '.lib', '.obj', '.pyc', '.bin',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.mp3', '.mp4', '.avi', '.mkv',
+    '.zip', '.7z', '.rar', '.gz', '.iso', '.msi', '.pdf'
+})
+_CONTENT_CACHE_SIZE = 256
+_CONTENT_CACHE_BYTES = 64 << 20
+_content_cache = OrderedDict()
+_content_cache_bytes = 0
+_SYSTEM_EXTENSIONS = frozenset({'.exe', '.dll', '.sys', '.drv', '.ocx', '.cpl', '.msi', '.msu'})
+_SYSTEM_FOLDERS = frozenset({'Windows', 'System32', 'SysWOW64', 'ProgramFiles', 'ProgramFilesX86'})
+_SYSTEM_FOLDER_RE = re.compile(
+    '|'.join(re.escape(folder) for folder in sorted(_SYSTEM_FOLDERS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+_ASCII_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+
+
+@lru_cache(maxsize=4096)
+def _lower_suffix(suffix: str) -> str:
+    """
+    Lowercase an already split file extension.
+    Cached with lru_cache, since the same few suffixes repeat across a tree.
+    
+    Args:
+        suffix: Extension including the dot
+    
+    Returns:
+        Lowercase extension
+    """
+    return suffix.lower()
+
+
+def _ext_lower(name: str) -> str:
+    """
+    Get the lowercase extension of a file name, including the dot.
+    Names whose only dot is the leading one (".gitignore") have no extension.
+    
+    Args:
+        name: File name
+    
+    Returns:
+        Lowercase extension, or an empty string
+    """
+    dot = name.rfind('.')
+    if dot <= 0:
+        return ''
+    return _lower_suffix(name[dot:])
+
+
+def _matching_line_numbers(buffer, find_next: Callable[[int], int]) -> List[int]:
+    """
+    Collect the numbers of lines that contain a match, each line once.
+    
+    Args:
+        buffer: File contents as bytes or a memory map
+        find_next: Returns the offset of the next match at or after a position, or -1
+    
+    Returns:
+        Sorted 1-based line numbers
+    """
+    matching_lines = []
+    line_num = 1
+    line_start = 0
+    pos = find_next(0)
+
+    while pos >= 0:
+        line_num += buffer[line_start:pos].count(b'\n')
+        matching_lines.append(line_num)
+
+        line_end = buffer.find(b'\n', pos)
+        if line_end < 0:
+            break
+
+        line_num += 1
+        line_start = line_end + 1
+        pos = find_next(line_start)
+
+    return matching_lines
+
+
+def _content_cache_get(cache_key: Tuple[str, int, int]) -> Optional[bytes]:
+    """
+    Look up file contents in the shared LRU cache, marking a hit as recently used.
+    
+    Args:
+        cache_key: Tuple of path, mtime in nanoseconds and size
+    
+    Returns:
+        Cached raw contents, or None if not cached
+    """
+    data = _content_cache.get(cache_key)
+    if data is not None:
+        _content_cache.move_to_end(cache_key)
+    return data
+
+
+def _content_cache_put(cache_key: Tuple[str, int, int], data: bytes) -> None:
+    """
+    Store file contents in the shared LRU cache, evicting the least recently
+    used entries once the entry or byte limit is exceeded.
+    
+    Args:
+        cache_key: Tuple of path, mtime in nanoseconds and size
+        data: Raw file contents
+    """
+    global _content_cache_bytes
+    previous = _content_cache.pop(cache_key, None)
+    if previous is not None:
+        _content_cache_bytes -= len(previous)
+
+    _content_cache[cache_key] = data
+    _content_cache_bytes += len(data)
+
+    while len(_content_cache) > _CONTENT_CACHE_SIZE or _content_cache_bytes > _CONTENT_CACHE_BYTES:
+        _, evicted = _content_cache.popitem(last=False)
+        _content_cache_bytes -= len(evicted)
+
+
+def _entry_stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """
+    Get the stat result of a directory entry without following symlinks.
+    DirEntry caches it, so every check on the same entry shares one lookup.
+    
+    Args:
+        entry: Directory entry
+    
+    Returns:
+        Stat result, or None if the entry can no longer be read
+    """
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+
 def find_files_windows(
         pattern: str,
         path: str,
@@ -31,35 +175,33 @@ def find_files_windows(
     """
     results = []
 
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 20:
-            return
-
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+    match_pattern = pattern if case_sensitive else pattern.lower()
+    name_match = re.compile(fnmatch.translate(match_pattern)).match
 
-        if depth == 0:
-            print(ru.SEARCH_PATTERN.format(pattern=pattern, path=path))
+    if case_sensitive:
+        def check_name(name: str, match=name_match) -> bool:
+            return match(name) is not None
+    else:
+        def check_name(name: str, match=name_match, lower=str.lower) -> bool:
+            return match(lower(name)) is not None
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
+    def search_iterative(start_path: str) -> int:
+        print(ru.SEARCH_PATTERN.format(pattern=pattern, path=path))
+        next_report = _PROGRESS_EVERY
+        total_files = 0
 
-            if item['type'] == 'folder':
-                search_recursive(item_path, depth + 1)
-            else:
-                filename = item['name']
-                if not case_sensitive:
-                    filename = filename.lower()
-                    match_pattern = pattern.lower()
-                else:
-                    match_pattern = pattern
+        for _, entries, _ in utils.walk_directory_levels(start_path, 20):
+            for entry in entries:
+                if utils.entry_is_file(entry):
+                    total_files += 1
+                    if check_name(entry.name):
+                        results.append(entry.path)
 
-                if fnmatch.fnmatch(filename, match_pattern):
-                    results.append(item_path)
+            if len(results) >= next_report:
+                next_report = len(results) + _PROGRESS_EVERY
+                print(ru.FILES_FOUND.format(count=len(results)))
 
-                    if len(results) % 100 == 0 and depth == 0:
-                        print(ru.FILES_FOUND.format(count=len(results)))
+        return total_files
 
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
@@ -67,11 +209,8 @@ def find_files_windows(
             print(ru.PATH_ERROR.format(error=error_msg))
             return results
 
-        search_recursive(path)
-
-        success, total_files = analysis.count_files(path)
-        if success and depth == 0:
-            print(ru.SEARCH_COMPLETE.format(found=len(results), total=total_files))
+        total_files = search_iterative(path)
+        print(ru.SEARCH_COMPLETE.format(found=len(results), total=total_files))
 
     except Exception as e:
         print(ru.SEARCH_ERROR.format(error=e))
@@ -98,26 +237,19 @@ def find_by_windows_extension(extensions: List[str], path: str) -> List[str]:
             ext = '.' + ext
         normalized_extensions.append(ext.lower())
 
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 20:
-            return
-
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+    extension_set = frozenset(normalized_extensions)
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
+    def search_iterative(start_path: str) -> None:
+        next_report = _PROGRESS_EVERY
 
-            if item['type'] == 'folder':
-                search_recursive(item_path, depth + 1)
-            else:
-                file_ext = os.path.splitext(item['name'])[1].lower()
-                if file_ext in normalized_extensions:
-                    results.append(item_path)
+        for _, entries, _ in utils.walk_directory_levels(start_path, 20):
+            for entry in entries:
+                if utils.entry_is_file(entry) and _ext_lower(entry.name) in extension_set:
+                    results.append(entry.path)
 
-                    if len(results) % 50 == 0 and depth == 0:
-                        print(ru.FILES_FOUND.format(count=len(results)))
+            if len(results) >= next_report:
+                next_report = len(results) + _PROGRESS_EVERY
+                print(ru.FILES_FOUND.format(count=len(results)))
 
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
@@ -126,7 +258,7 @@ def find_by_windows_extension(extensions: List[str], path: str) -> List[str]:
             return results
 
         print(ru.SEARCH_EXTENSIONS.format(extensions=', '.join(normalized_extensions)))
-        search_recursive(path)
+        search_iterative(path)
         print(ru.FILES_FOUND.format(count=len(results)))
 
     except Exception as e:
@@ -137,7 +269,8 @@ def find_by_windows_extension(extensions: List[str], path: str) -> List[str]:
 
 def find_large_files_windows(
         min_size_mb: float,
-        path: str
+        path: str,
+        top_k: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Find files larger than the specified minimum size.
@@ -145,44 +278,58 @@ def find_large_files_windows(
     Args:
         min_size_mb: Minimum file size in megabytes
         path: Directory path to start search from
+        top_k: Optional number of largest files to keep; all matches are kept if omitted
     
     Returns:
-        List of dictionaries containing file information (path, name, size, etc.)
+        List of dictionaries containing file information (path, name, size, etc.),
+        largest first
     """
     results = []
-    min_size_bytes = min_size_mb * 1024 * 1024
+    heap = []
+    found = 0
+    min_size_bytes = int(min_size_mb * 1024 * 1024)
 
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 20:
-            return
+    def search_iterative(start_path: str) -> None:
+        nonlocal found
+        next_report = _PROGRESS_EVERY
 
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+        for _, entries, _ in utils.walk_directory_levels(start_path, 20):
+            for entry in entries:
+                if not utils.entry_is_file(entry):
+                    continue
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
+                stat_info = _entry_stat(entry)
+                if stat_info is None:
+                    continue
 
-            if item['type'] == 'folder':
-                search_recursive(item_path, depth + 1)
-            else:
-                file_size = item.get('size', 0)
+                file_size = stat_info.st_size
                 if file_size >= min_size_bytes:
-                    file_ext = os.path.splitext(item['name'])[1].lower()
+                    name = entry.name
+                    file_ext = _ext_lower(name)
+                    attrs = analysis.windows_attrs_from_flags(getattr(stat_info, 'st_file_attributes', 0))
 
                     file_info = {
-                        'path': item_path,
-                        'name': item['name'],
+                        'path': entry.path,
+                        'name': name,
                         'size_bytes': file_size,
                         'size_mb': file_size / (1024 * 1024),
                         'type': file_ext,
-                        'modified': item.get('modified', ''),
-                        'hidden': item.get('hidden', False)
+                        'modified': time.strftime("%Y-%m-%d", time.localtime(stat_info.st_mtime)),
+                        'hidden': attrs.hidden,
+                        'attrs': attrs
                     }
-                    results.append(file_info)
+                    found += 1
+
+                    if top_k is None:
+                        results.append(file_info)
+                    else:
+                        heapq.heappush(heap, (file_size, -found, file_info))
+                        if len(heap) > top_k:
+                            heapq.heappop(heap)
 
-                    if len(results) % 10 == 0 and depth == 0:
-                        print(ru.FILES_FOUND.format(count=len(results)))
+            if found >= next_report:
+                next_report = found + _PROGRESS_EVERY
+                print(ru.FILES_FOUND.format(count=found))
 
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
@@ -191,11 +338,14 @@ def find_large_files_windows(
             return results
 
         print(ru.LARGE_FILES_SEARCH.format(size=min_size_mb))
-        search_recursive(path)
+        search_iterative(path)
 
-        results.sort(key=lambda x: x['size_bytes'], reverse=True)
+        if top_k is None:
+            results.sort(key=lambda x: x['size_bytes'], reverse=True)
+        else:
+            results = [file_info for _, _, file_info in sorted(heap, reverse=True)]
 
-        print(ru.LARGE_FILES_FOUND.format(count=len(results)))
+        print(ru.LARGE_FILES_FOUND.format(count=found))
 
     except Exception as e:
         print(ru.SEARCH_ERROR.format(error=e))
@@ -203,7 +353,7 @@ def find_large_files_windows(
     return results
 
 
-def find_windows_system_files(path: str) -> List[str]:
+def find_windows_system_files(path: str) -> List[Tuple[str, Optional[int]]]:
     """
     Search for Windows system files in the specified path.
     
@@ -211,39 +361,25 @@ def find_windows_system_files(path: str) -> List[str]:
         path: Directory path to start search from
     
     Returns:
-        List of full paths to system files
+        List of tuples containing full path and size in bytes (None if unknown)
+        of each system file
     """
     results = []
-
-    system_extensions = {'.exe', '.dll', '.sys', '.drv', '.ocx', '.cpl', '.msi', '.msu'}
+    system_folder_search = _SYSTEM_FOLDER_RE.search
 
     special_folders = navigation.get_windows_special_folders()
-    system_folders = {'Windows', 'System32', 'SysWOW64', 'ProgramFiles', 'ProgramFilesX86'}
-
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 10:
-            return
 
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+    def is_system_folder(entry: os.DirEntry, depth: int) -> bool:
+        return depth == 0 or system_folder_search(entry.name) is not None
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
-
-            if item['type'] == 'folder':
-                folder_name = item['name'].lower()
-                is_system_folder = any(
-                    sys_folder.lower() in folder_name
-                    for sys_folder in system_folders
-                )
-
-                if is_system_folder or depth == 0:
-                    search_recursive(item_path, depth + 1)
-            else:
-                file_ext = os.path.splitext(item['name'])[1].lower()
-                if file_ext in system_extensions:
-                    results.append(item_path)
+    def search_iterative(start_path: str) -> None:
+        for _, entries, _ in utils.walk_directory_levels(start_path, 10, is_system_folder):
+            for entry in entries:
+                if utils.entry_is_file(entry):
+                    file_ext = _ext_lower(entry.name)
+                    if file_ext in _SYSTEM_EXTENSIONS:
+                        stat_info = _entry_stat(entry)
+                        results.append((entry.path, stat_info.st_size if stat_info else None))
 
     try:
         is_valid, error_msg = utils.validate_windows_path(path)
@@ -255,11 +391,11 @@ def find_windows_system_files(path: str) -> List[str]:
 
         if not path or path == "/" or path == "\\":
             for folder_name, folder_path in special_folders.items():
-                if folder_name in system_folders:
+                if folder_name in _SYSTEM_FOLDERS:
                     print(ru.SCANNING_FOLDER.format(folder=folder_name))
-                    search_recursive(folder_path, 0)
+                    search_iterative(folder_path)
         else:
-            search_recursive(path, 0)
+            search_iterative(path)
 
         print(ru.SYSTEM_FILES_FOUND.format(count=len(results)))
 
@@ -338,8 +474,14 @@ def search_menu_handler(current_path: str) -> bool:
                     print(f"\n{ru.LARGE_FILES_TOTAL.format(count=len(results), size=min_size)}")
                     format_windows_search_results(results, "large")
 
-                    total_size_mb = sum(f['size_mb'] for f in results)
-                    largest_file = max(results, key=lambda x: x['size_mb'])
+                    total_size_mb = 0.0
+                    largest_file = results[0]
+                    for file_info in results:
+                        size_mb = file_info['size_mb']
+                        total_size_mb += size_mb
+                        if size_mb > largest_file['size_mb']:
+                            largest_file = file_info
+
                     print(f"\n{ru.TOTAL_SIZE_MB.format(size=total_size_mb)}")
                     print(ru.LARGEST_FILE.format(name=largest_file['name'], size=largest_file['size_mb']))
                 else:
@@ -356,8 +498,8 @@ def search_menu_handler(current_path: str) -> bool:
                 format_windows_search_results(results, "system")
 
                 ext_count = defaultdict(int)
-                for file_path in results:
-                    ext = os.path.splitext(file_path)[1].lower()
+                for file_path, _ in results:
+                    ext = _ext_lower(file_path)
                     ext_count[ext] += 1
 
                 print(f"\n{ru.FILE_TYPE_DISTRIBUTION}")
@@ -388,7 +530,8 @@ def format_windows_search_results(results: List, search_type: str) -> None:
     Format and display search results based on search type.
     
     Args:
-        results: List of search results (file paths or file info dictionaries)
+        results: List of search results (file paths, file info dictionaries
+            or (path, size) tuples)
         search_type: Type of search ("pattern", "extension", "large", or "system")
     """
     if not results:
@@ -433,8 +576,8 @@ def format_windows_search_results(results: List, search_type: str) -> None:
             sample_files = results[:min(100, len(results))]
             attr_stats = defaultdict(int)
             for file_info in sample_files:
-                attrs = analysis.get_windows_file_attributes(file_info['path'])
-                for attr_name, attr_value in attrs.items():
+                attrs = file_info.get('attrs') or analysis.get_windows_file_attributes(file_info['path'])
+                for attr_name, attr_value in zip(attrs._fields, attrs):
                     if attr_value:
                         attr_stats[attr_name] += 1
 
@@ -448,7 +591,7 @@ def format_windows_search_results(results: List, search_type: str) -> None:
         print(f"{'#':<3} {ru.NAME:<30} {ru.PATH_COL:<40} {ru.SIZE:<10}")
         print("-" * 85)
 
-        for i, file_path in enumerate(results[:30], 1):
+        for i, (file_path, size) in enumerate(results[:30], 1):
             filename = os.path.basename(file_path)
             if len(filename) > 28:
                 filename = filename[:25] + "..."
@@ -457,11 +600,7 @@ def format_windows_search_results(results: List, search_type: str) -> None:
             if len(dirname) > 38:
                 dirname = "..." + dirname[-35:]
 
-            try:
-                size = os.path.getsize(file_path)
-                size_str = utils.format_size(size)
-            except Exception:
-                size_str = "N/A"
+            size_str = utils.format_size(size) if size is not None else "N/A"
 
             print(f"{i:<3} {filename:<30} {dirname:<40} {size_str:<10}")
 
@@ -475,7 +614,8 @@ def recursive_content_search(
         root_path: str,
         search_pattern: str,
         file_extensions: List[str] = None,
-        content_cache: Dict[str, str] = None
+        content_cache: Optional[MutableMapping[Tuple[str, int, int], bytes]] = None,
+        include_large_files: bool = False
 ) -> List[Tuple[str, List[int]]]:
     """
     Recursively search for text content within files.
@@ -484,78 +624,98 @@ def recursive_content_search(
         root_path: Directory path to start search from
         search_pattern: Text pattern to search for
         file_extensions: Optional list of file extensions to filter by
-        content_cache: Optional cache of file contents
+        content_cache: Optional mapping used as a plain, unbounded cache of raw
+            file contents keyed by (path, mtime, size); defaults to a bounded
+            LRU cache shared between searches
+        include_large_files: Whether to search files above 256 MB
     
     Returns:
         List of tuples containing file path and line numbers where pattern was found
+        (binary files are skipped)
     """
     results = []
     if content_cache is None:
-        content_cache = {}
-
-    encodings = ['utf-8', 'cp1251', 'cp866', 'latin-1']
-
-    def search_in_file(file_path: str) -> List[int]:
-        matching_lines = []
-
-        if file_path in content_cache:
-            content = content_cache[file_path]
-        else:
-            content = None
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
+        cache_get, cache_put = _content_cache_get, _content_cache_put
+    else:
+        cache_get, cache_put = content_cache.get, content_cache.__setitem__
+
+    needle = search_pattern.lower()
+    ascii_needle = needle.encode('ascii') if needle.isascii() else None
+    if ascii_needle is not None:
+        needle_search = re.compile(re.escape(ascii_needle), re.IGNORECASE).search
+
+    def search_mapped(file_handle) -> List[int]:
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            def find_next(start: int) -> int:
+                match = needle_search(mapped, start)
+                return match.start() if match else -1
+
+            return _matching_line_numbers(mapped, find_next)
+
+    def search_in_file(file_path: str, stat_info: os.stat_result) -> List[int]:
+        cache_key = (file_path, stat_info.st_mtime_ns, stat_info.st_size)
+        data = cache_get(cache_key)
+        if data is None:
+            try:
+                with open(file_path, 'rb') as f:
+                    head = f.read(_SNIFF_SIZE)
+                    if b'\0' in head:
+                        return []
+
+                    if ascii_needle is not None and stat_info.st_size >= _MMAP_MIN_SIZE:
+                        return search_mapped(f)
+                    data = head + f.read()
+            except (OSError, ValueError):
+                return []
+
+            if len(data) <= _CONTENT_CACHE_BYTES:
+                cache_put(cache_key, data)
+
+        if ascii_needle is None:
+            matching_lines = []
+            lines = data.decode('utf-8', errors='ignore').split('\n')
+            for line_num, line in enumerate(lines, 1):
+                if needle in line.lower():
+                    matching_lines.append(line_num)
+            return matching_lines
+
+        content = data.translate(_ASCII_LOWER)
+        return _matching_line_numbers(content, lambda start: content.find(ascii_needle, start))
+
+    def search_iterative(start_path: str) -> None:
+        next_report = _PROGRESS_EVERY
+
+        for _, entries, _ in utils.walk_directory_levels(start_path, 10):
+            for entry in entries:
+                if not utils.entry_is_file(entry):
                     continue
-                except Exception:
-                    break
-
-            if content is None:
-                return matching_lines
-
-            content_cache[file_path] = content
-
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            if search_pattern.lower() in line.lower():
-                matching_lines.append(line_num)
-
-        return matching_lines
-
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 10:
-            return
-
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
-
-            if item['type'] == 'folder':
-                search_recursive(item_path, depth + 1)
-            else:
+                file_ext = _ext_lower(entry.name)
                 if file_extensions:
-                    file_ext = os.path.splitext(item['name'])[1].lower()
                     if file_ext not in file_extensions:
                         continue
+                elif file_ext in _BINARY_EXTENSIONS:
+                    continue
 
+                item_path = entry.path
                 try:
-                    matching_lines = search_in_file(item_path)
+                    stat_info = entry.stat()
+                    if stat_info.st_size > _MAX_CONTENT_FILE_SIZE and not include_large_files:
+                        continue
+
+                    matching_lines = search_in_file(item_path, stat_info)
                     if matching_lines:
                         results.append((item_path, matching_lines))
-
-                        if len(results) % 10 == 0:
-                            print(ru.FILES_FOUND.format(count=len(results)))
-                except Exception:
+                except OSError:
                     continue
 
+            if len(results) >= next_report:
+                next_report = len(results) + _PROGRESS_EVERY
+                print(ru.FILES_FOUND.format(count=len(results)))
+
     try:
         print(ru.CONTENT_SEARCH.format(pattern=search_pattern))
-        search_recursive(root_path)
+        search_iterative(root_path)
         print(ru.CONTENT_FILES_FOUND.format(count=len(results)))
 
     except Exception as e:
@@ -586,52 +746,58 @@ def smart_recursive_search(
 
     query_terms = query.lower().split()
 
-    def calculate_relevance(content: str, filename: str) -> float:
-        text = (content + " " + filename).lower()
+    term_weights = Counter(query_terms)
+    term_pattern = re.compile('|'.join(
+        re.escape(term) for term in sorted(term_weights, key=len, reverse=True)
+    ))
+
+    def count_terms(text: str) -> int:
+        return sum(term_weights[match] for match in term_pattern.findall(text))
 
-        total_terms = len(text.split())
-        if total_terms == 0:
+    def calculate_relevance(content: str, filename: str) -> float:
+        if not term_weights:
             return 0.0
 
-        term_count = 0
-        for term in query_terms:
-            term_count += text.count(term)
+        content = content.lower()
+        filename = filename.lower()
 
-        relevance = term_count / max(total_terms, 1)
-        return min(relevance, 1.0)
+        term_count = count_terms(content) + count_terms(filename)
+        if term_count == 0:
+            return 0.0
 
-    def search_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 8:
-            return
+        total_terms = len(content.split()) + len(filename.split())
+        return min(term_count / total_terms, 1.0)
 
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
+    def is_relevant_folder(entry: os.DirEntry, depth: int) -> bool:
+        return calculate_relevance("", entry.name) >= relevance_threshold
 
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
+    def search_iterative(start_path: str) -> None:
+        for _, entries, _ in utils.walk_directory_levels(start_path, 8, is_relevant_folder):
+            for entry in entries:
+                if not utils.entry_is_file(entry):
+                    continue
 
-            if item['type'] == 'folder':
-                folder_relevance = calculate_relevance("", item['name'])
-                if folder_relevance >= relevance_threshold:
-                    search_recursive(item_path, depth + 1)
-            else:
+                name = entry.name
+                item_path = entry.path
                 try:
-                    with open(item_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read(10000)
+                    content = ""
+                    if _ext_lower(name) not in _BINARY_EXTENSIONS:
+                        with open(item_path, 'r', encoding='utf-8', errors='ignore') as f:
+                            if b'\0' not in f.buffer.peek(_SNIFF_SIZE)[:_SNIFF_SIZE]:
+                                content = f.read(10000)
 
-                    relevance = calculate_relevance(content, item['name'])
+                    relevance = calculate_relevance(content, name)
                     if relevance >= relevance_threshold:
                         results.append((item_path, relevance))
 
                 except Exception:
-                    relevance = calculate_relevance("", item['name'])
+                    relevance = calculate_relevance("", name)
                     if relevance >= relevance_threshold:
                         results.append((item_path, relevance))
 
     try:
         print(ru.SMART_SEARCH.format(query=query))
-        search_recursive(root_path)
+        search_iterative(root_path)
 
         results.sort(key=lambda x: x[1], reverse=True)
 
@@ -682,92 +848,86 @@ def recursive_security_scan(
 
     import time
 
-    def check_suspicious_location(file_path: str) -> bool:
-        file_path_lower = file_path.lower()
-        for location in rules['suspicious_locations']:
-            if location in file_path_lower:
-                return True
-        return False
+    suspicious_locations = rules['suspicious_locations']
+    location_search = re.compile(
+        '|'.join(re.escape(location) for location in suspicious_locations)
+    ).search if suspicious_locations else None
+    dangerous_extensions = frozenset(rules['dangerous_extensions'])
+
+    def check_suspicious_location(file_path_lower: str) -> bool:
+        return location_search is not None and location_search(file_path_lower) is not None
 
     def check_dangerous_extension(filename: str) -> bool:
-        file_ext = os.path.splitext(filename)[1].lower()
-        return file_ext in rules['dangerous_extensions']
-
-    def check_temp_file_age(file_path: str) -> bool:
-        try:
-            stat_info = os.stat(file_path)
-            file_age = time.time() - stat_info.st_mtime
-            max_age = rules['max_temp_file_age_days'] * 24 * 60 * 60
-            return file_age > max_age
-        except Exception:
-            return False
-
-    def scan_recursive(current_path: str, depth: int = 0) -> None:
-        if depth > 5:
-            return
-
-        success, items = navigation.list_directory(current_path)
-        if not success:
-            return
-
-        for item in items:
-            item_path = os.path.join(current_path, item['name'])
-
-            if item['type'] == 'folder':
-                if rules['check_hidden_files'] and item.get('hidden', False):
-                    results['hidden_objects'].append({
-                        'path': item_path,
-                        'type': 'folder',
-                        'reason': 'Hidden folder',
-                        'severity': 'medium'
-                    })
-
-                scan_recursive(item_path, depth + 1)
-            else:
-                if check_dangerous_extension(item['name']):
-                    if check_suspicious_location(item_path):
-                        results['suspicious_executables'].append({
+        return _ext_lower(filename) in dangerous_extensions
+
+    def check_temp_file_age(stat_info: os.stat_result) -> bool:
+        file_age = time.time() - stat_info.st_mtime
+        max_age = rules['max_temp_file_age_days'] * 24 * 60 * 60
+        return file_age > max_age
+
+    def scan_iterative(start_path: str) -> None:
+        for current_path, entries, _ in utils.walk_directory_levels(start_path, 5):
+            for entry in entries:
+                name = entry.name
+                item_path = entry.path
+
+                if utils.entry_is_dir(entry):
+                    if rules['check_hidden_files'] and navigation.get_windows_attrs(entry) & stat.FILE_ATTRIBUTE_HIDDEN:
+                        results['hidden_objects'].append({
                             'path': item_path,
-                            'name': item['name'],
-                            'location': current_path,
-                            'reason': 'Executable in suspicious location',
-                            'severity': 'high'
+                            'type': 'folder',
+                            'reason': 'Hidden folder',
+                            'severity': 'medium'
                         })
-
-                if rules['check_hidden_files'] and item.get('hidden', False):
-                    results['hidden_objects'].append({
-                        'path': item_path,
-                        'type': 'file',
-                        'name': item['name'],
-                        'reason': 'Hidden file',
-                        'severity': 'low'
-                    })
-
-                if 'temp' in item_path.lower() or item['name'].lower().endswith('.tmp'):
-                    if check_temp_file_age(item_path):
-                        results['temp_files'].append({
+                elif utils.entry_is_file(entry):
+                    stat_info = _entry_stat(entry)
+                    path_lower = item_path.lower()
+
+                    if check_dangerous_extension(name):
+                        if check_suspicious_location(path_lower):
+                            results['suspicious_executables'].append({
+                                'path': item_path,
+                                'name': name,
+                                'location': current_path,
+                                'reason': 'Executable in suspicious location',
+                                'severity': 'high'
+                            })
+
+                    file_attributes = getattr(stat_info, 'st_file_attributes', 0)
+                    if rules['check_hidden_files'] and file_attributes & stat.FILE_ATTRIBUTE_HIDDEN:
+                        results['hidden_objects'].append({
                             'path': item_path,
-                            'name': item['name'],
-                            'reason': 'Old temporary file',
+                            'type': 'file',
+                            'name': name,
+                            'reason': 'Hidden file',
                             'severity': 'low'
                         })
 
-                if rules['check_open_permissions']:
-                    try:
-                        if os.access(item_path, os.W_OK):
-                            if 'system' in item_path.lower() or 'windows' in item_path.lower():
+                    if stat_info is None:
+                        continue
+
+                    if 'temp' in path_lower or name.lower().endswith('.tmp'):
+                        if check_temp_file_age(stat_info):
+                            results['temp_files'].append({
+                                'path': item_path,
+                                'name': name,
+                                'reason': 'Old temporary file',
+                                'severity': 'low'
+                            })
+
+                    if rules['check_open_permissions']:
+                        if 'system' in path_lower or 'windows' in path_lower:
+                            if stat_info.st_mode & stat.S_IWRITE:
                                 results['open_permissions'].append({
                                     'path': item_path,
-                                    'name': item['name'],
+                                    'name': name,
                                     'reason': 'System file is writable',
                                     'severity': 'high'
                                 })
-                    except Exception:
-                        pass
 
     try:
         print(ru.SECURITY_SCAN)
-        scan_recursive(root_path)
+        scan_iterative(root_path)
 
         total_threats = sum(len(category) for category in results.values())
         print(ru.SECURITY_SCAN_COMPLETE.format(count=total_threats))
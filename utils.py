@@ -1,25 +1,70 @@
 # utils.py
-from typing import Dict, Any, List, Union, Tuple
+from typing import Dict, Any, List, Union, Tuple, Generator, Optional, Callable
+from collections import defaultdict
 import os
+import re
+import stat
 import platform
 from pathlib import Path
 import ctypes
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import ru_local as ru
 
 PathString = Union[str, Path]
 
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 2
+ERROR_FILE_NOT_FOUND = 2
+ERROR_NO_MORE_FILES = 18
+_FILETIME_UNIX_EPOCH = 116444736000000000
+
+_IS_WINDOWS: bool = platform.system() == "Windows"
+
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_SCALES = (1, 1024, 1024**2, 1024**3, 1024**4)
+
+_FORBIDDEN_CHARS = '/*?"<>|'
+_FORBIDDEN_SET = frozenset(_FORBIDDEN_CHARS)
+_VALID_PATH_RE = re.compile(r'[A-Za-z]:(?:\\[^/*?"<>|:]*)?|[^/*?"<>|:]*')
+
+_FindFirstFileExW = None
+_GetLogicalDrives = None
+
+if os.name == 'nt':
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    _FindFirstFileExW = _kernel32.FindFirstFileExW
+    _FindFirstFileExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                                  ctypes.c_int, wintypes.LPVOID, wintypes.DWORD]
+    _FindFirstFileExW.restype = wintypes.HANDLE
+
+    _FindNextFileW = _kernel32.FindNextFileW
+    _FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _FindNextFileW.restype = wintypes.BOOL
+
+    _FindClose = _kernel32.FindClose
+    _FindClose.argtypes = [wintypes.HANDLE]
+    _FindClose.restype = wintypes.BOOL
+
+    _GetLogicalDrives = _kernel32.GetLogicalDrives
+    _GetLogicalDrives.argtypes = []
+    _GetLogicalDrives.restype = wintypes.DWORD
+
 def is_windows_os() -> bool:
     """
     Check if the program is running on Windows operating system.
     Returns:
         bool: True if running on Windows, False otherwise
     """
-    operating_system = platform.system()
-    
-    if operating_system == "Windows":
-        return True
-    return False
+    return _IS_WINDOWS
 
 
 def validate_windows_path(path: PathString) -> Tuple[bool, str]:
@@ -30,10 +75,27 @@ def validate_windows_path(path: PathString) -> Tuple[bool, str]:
     Returns:
         (validity, error reporting)
     """
-    if not is_windows_os():
+    if not _IS_WINDOWS:
         return False, ru.ONLY_WINDOWS
     
-    path_str = str(path)
+    return _validate_path_string(str(path))
+
+
+@lru_cache(maxsize=4096)
+def _validate_path_string(path_str: str) -> Tuple[bool, str]:
+    """
+    Syntax checks of validate_windows_path. They depend only on the string,
+    so results are cached across calls (parents are validated repeatedly).
+    Args:
+        path_str (str): Path to check
+    Returns:
+        Tuple[bool, str]: (validity, error reporting)
+    """
+    if len(path_str) > 260:
+        return False, ru.PATH_TOO_LONG
+    
+    if _VALID_PATH_RE.fullmatch(path_str):
+        return True, ""
     
     if ':' in path_str:
         if path_str.count(':') > 1:
@@ -49,13 +111,10 @@ def validate_windows_path(path: PathString) -> Tuple[bool, str]:
         if len(path_str) > 2 and path_str[2] != '\\':
             return False, ru.MISSING_BACKSLASH
  
-    forbidden_chars = ['/', '*', '?', '"', '<', '>', '|']
-    for char in forbidden_chars:
-        if char in path_str:
-            return False, ru.FORBIDDEN_CHAR.format(char=char)
-
-    if len(path_str) > 260:
-        return False, ru.PATH_TOO_LONG
+    forbidden_found = _FORBIDDEN_SET.intersection(path_str)
+    if forbidden_found:
+        char = next(char for char in _FORBIDDEN_CHARS if char in forbidden_found)
+        return False, ru.FORBIDDEN_CHAR.format(char=char)
     
     return True, ""
 
@@ -70,14 +129,9 @@ def format_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024**2:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024**3:
-        return f"{size_bytes / (1024**2):.1f} MB"
-    elif size_bytes < 1024**4:
-        return f"{size_bytes / (1024**3):.1f} GB"
-    else:
-        return f"{size_bytes / (1024**4):.1f} TB"
+    
+    unit_index = min(4, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / _SIZE_SCALES[unit_index]:.1f} {_SIZE_UNITS[unit_index]}"
     
 
 def get_parent_path(path: PathString) -> str:
@@ -111,135 +165,430 @@ def safe_windows_listdir(path: PathString) -> List[str]:
         return []    
 
 
-def is_hidden_windows_file(path: PathString) -> bool:
+def get_logical_drives() -> List[str]:
+    """
+    Get drive letters present in the system with a single GetLogicalDrives call.
+    Returns:
+        List[str]: Drive letters (['C:', 'D:', ...]), empty list off Windows
+    """
+    if _GetLogicalDrives is None:
+        return []
+
+    mask = _GetLogicalDrives()
+    return [chr(ord('A') + i) + ":" for i in range(26) if mask & (1 << i)]
+
+
+def iter_windows_find_data(path: PathString) -> Generator[Tuple[str, int, int, float], None, None]:
+    """
+    Enumerate a directory with FindFirstFileExW (basic info, large fetch).
+    Off Windows the same tuples are built from os.scandir.
+    Args:
+        path (PathString): Directory path to enumerate
+    Yields:
+        Tuple[str, int, int, float]: (name, file attributes, size in bytes, modification time)
+    Raises:
+        OSError: If the directory cannot be opened or read
+    """
+    if _FindFirstFileExW is None:
+        with os.scandir(str(path)) as it:
+            for entry in it:
+                try:
+                    stat_info = entry.stat()
+                except OSError:
+                    continue
+                attributes = getattr(stat_info, 'st_file_attributes', 0)
+                if stat.S_ISDIR(stat_info.st_mode):
+                    attributes |= stat.FILE_ATTRIBUTE_DIRECTORY
+                yield entry.name, attributes, stat_info.st_size, stat_info.st_mtime
+        return
+
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = _FindFirstFileExW(os.path.join(str(path), '*'), FIND_EX_INFO_BASIC, ctypes.byref(data),
+                               FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH)
+    if handle == _INVALID_HANDLE_VALUE:
+        error = ctypes.get_last_error()
+        if error == ERROR_FILE_NOT_FOUND:
+            return
+        raise ctypes.WinError(error)
+
+    try:
+        while True:
+            name = data.cFileName
+            if name != '.' and name != '..':
+                size = (data.nFileSizeHigh << 32) | data.nFileSizeLow
+                write_time = (data.ftLastWriteTime.dwHighDateTime << 32) | data.ftLastWriteTime.dwLowDateTime
+                yield name, data.dwFileAttributes, size, (write_time - _FILETIME_UNIX_EPOCH) / 10_000_000
+
+            if not _FindNextFileW(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error != ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(error)
+                return
+    finally:
+        _FindClose(handle)
+
+
+def is_hidden_windows_file(path: PathString, *, stat_result: Optional[os.stat_result] = None) -> bool:
     """
     Check if a file or directory is hidden in Windows.
     Args:
         path (PathString): Path to file or directory
+        stat_result (os.stat_result | None): Already known stat result of path,
+            e.g. from DirEntry.stat(); path is statted only if omitted
     Returns:
         bool: True if file has hidden attribute, False otherwise or on error
     """
     try:
-        file_info = os.stat(path)
+        file_info = stat_result if stat_result is not None else os.stat(path)
         if hasattr(file_info, 'st_file_attributes'):
             marks = file_info.st_file_attributes
             return bool(marks & 2)
         
-        attributes = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-        return attributes != -1 and (attributes & 2)
+        return False
         
     except Exception:
         return False
     
 
-def validate_windows_path_recursive(path: PathString, depth: int = 0) -> Tuple[bool, List[str]]:
+def validate_windows_path_recursive(path: PathString) -> Tuple[bool, List[str]]:
     """
-    Recursively validate a Windows path and all parent directories.
+    Validate a Windows path and all parent directories.
     Args:
         path (PathString): Path to validate (string or Path object)
-        depth (int): Current recursion depth (internal use, default: 0)
     Returns:
         Tuple[bool, List[str]]: 
             - True if all path levels are valid, False otherwise
-            - List of error messages for invalid segments (empty if valid)
+            - List of error messages for invalid segments (empty if valid),
+              from the path itself up to the root
     """
-    MAX_RECURSION_DEPTH = 100
-    
-    if not is_windows_os():
+    if not _IS_WINDOWS:
         return False, [ru.FUNCTION_WINDOWS_ONLY]
     
-    if depth > MAX_RECURSION_DEPTH:
-        return False, [ru.MAX_RECURSION_DEPTH]
-    
-    path_str = str(path)
+    current = str(path)
     problems = []
+    dirname = os.path.dirname
+    
+    while True:
+        is_valid, error_msg = validate_windows_path(current)
+        
+        if not is_valid:
+            problems.append(f"{current}: {error_msg}")
+        
+        parent = dirname(current)
+        if parent == current or not parent:
+            break
+        current = parent
+    
+    return not problems, problems
+
+
+def _metadata_node(path_str: str, name: str, is_dir: bool, is_file: bool,
+                   stat_info: Optional[os.stat_result], level: int) -> Dict[str, Any]:
+    """
+    Build the metadata dictionary of a single file system object.
+    Args:
+        path_str (str): Full path of the object
+        name (str): Display name
+        is_dir (bool): Whether the object is a directory
+        is_file (bool): Whether the object is a regular file
+        stat_info (os.stat_result | None): Stat result, None if unavailable
+        level (int): Depth below the starting directory
+    Returns:
+        Dict[str, Any]: Metadata without performance metrics
+    """
+    return {
+        "path": path_str,
+        "name": name,
+        "type": "directory" if is_dir else "file",
+        "level": level,
+        "hidden": stat_info is not None and is_hidden_windows_file(path_str, stat_result=stat_info),
+        "size": stat_info.st_size if is_file and stat_info is not None else 0,
+        "children": [],
+        "file_stats": {
+            "total": 0,
+            "hidden": 0,
+            "by_extension": defaultdict(int)
+        }
+    }
+
+
+def _directory_id(path_str: str, stat_info: Optional[os.stat_result]) -> Optional[Tuple[int, int]]:
+    """
+    Get the (device, file index) pair identifying a directory.
+    Args:
+        path_str (str): Directory path
+        stat_info (os.stat_result | None): Known stat result of the directory;
+            DirEntry stats on Windows carry no file index, so it is then re-read
+    Returns:
+        Optional[Tuple[int, int]]: Directory identity, None if it cannot be read
+    """
+    try:
+        if stat_info is None or not stat_info.st_ino:
+            stat_info = os.stat(path_str)
+        return stat_info.st_dev, stat_info.st_ino
+    except OSError:
+        return None
+
+
+def scan_directory(path: str) -> List[os.DirEntry]:
+    """
+    List the scandir entries of a directory.
+    Args:
+        path (str): Directory path
+    Returns:
+        List[os.DirEntry]: Entries of the directory, empty if it cannot be read
+    """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def entry_is_dir(entry: os.DirEntry) -> bool:
+    """
+    Check whether a directory entry is a directory, following symlinks.
+    Args:
+        entry (os.DirEntry): Directory entry
+    Returns:
+        bool: True if the entry resolves to a directory, False for dangling
+              or looping links and on error
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def entry_is_file(entry: os.DirEntry) -> bool:
+    """
+    Check whether a directory entry is a regular file, following symlinks.
+    Args:
+        entry (os.DirEntry): Directory entry
+    Returns:
+        bool: True if the entry resolves to a regular file, False for directory
+              symlinks, dangling or looping links and on error
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def walk_directory_levels(path: str, max_depth: int,
+                          descend: Optional[Callable[[os.DirEntry, int], bool]] = None
+                          ) -> Generator[Tuple[str, List[os.DirEntry], int], None, None]:
+    """
+    Walk a directory tree breadth-first, listing the directories of each
+    level concurrently in a thread pool. Only real directories are walked:
+    symlinks to directories are listed as entries but never descended into.
+    Args:
+        path (str): Directory to start from (depth 0)
+        max_depth (int): Deepest level whose directories are listed
+        descend (Callable[[os.DirEntry, int], bool] | None): Optional predicate
+            (entry, depth) deciding whether a subdirectory is walked;
+            all subdirectories are walked if omitted
+    Yields:
+        Tuple[str, List[os.DirEntry], int]: Directory path, its entries and its depth
+    """
+    frontier = [path]
+    depth = 0
+    
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        while frontier:
+            next_frontier = []
+            
+            for current_path, entries in zip(frontier, executor.map(scan_directory, frontier)):
+                if depth < max_depth:
+                    for entry in entries:
+                        try:
+                            is_real_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            is_real_dir = False
+                        
+                        if is_real_dir and (descend is None or descend(entry, depth)):
+                            next_frontier.append(entry.path)
+                
+                yield current_path, entries, depth
+            
+            frontier = next_frontier
+            depth += 1
+
+
+def _child_metadata(entry: os.DirEntry, level: int, max_depth: int) -> Dict[str, Any]:
+    """
+    Build the metadata of a directory entry.
+    Directories at max_depth are never expanded, so they skip the size
+    lookup and get size 0 and empty file_stats; their hidden flag is only
+    read where the entry stat is free (Windows). Symlinks to directories
+    are reported as directories but never descended into.
+    Args:
+        entry (os.DirEntry): Directory entry
+        level (int): Depth of the entry below the starting directory
+        max_depth (int): Maximum depth of the walk
+    Returns:
+        Dict[str, Any]: Metadata of the entry
+    """
+    try:
+        is_dir = entry.is_dir()
+    except OSError:
+        is_dir = False
+    
+    if is_dir and level >= max_depth:
+        hidden = False
+        if _IS_WINDOWS:
+            try:
+                hidden = is_hidden_windows_file(entry.path, stat_result=entry.stat(follow_symlinks=False))
+            except OSError:
+                pass
+        
+        return {
+            "path": entry.path,
+            "name": entry.name,
+            "type": "directory",
+            "level": level,
+            "hidden": hidden,
+            "size": 0,
+            "children": [],
+            "file_stats": {
+                "total": 0,
+                "hidden": 0,
+                "by_extension": defaultdict(int)
+            },
+            "recursion_depth": level
+        }
     
-    is_valid, error_msg = validate_windows_path(path_str)
+    try:
+        is_file = entry.is_file()
+    except OSError:
+        is_file = False
     
-    if not is_valid:
-        problems.append(f"{path_str}: {error_msg}")
+    try:
+        child_stat = entry.stat()
+    except OSError:
+        child_stat = None
+    
+    child_metadata = _metadata_node(entry.path, entry.name, is_dir,
+                                    is_file, child_stat, level)
+    child_metadata["recursion_depth"] = level
+    return child_metadata
+
 
-    parent = get_parent_path(path_str)
-    if parent != path_str and parent:
-        parent_valid, parent_problems = validate_windows_path_recursive(parent, depth + 1)
+def _iter_child_metadata(path_str: str, start_depth: int,
+                         max_depth: int) -> Generator[Tuple[str, List[Dict[str, Any]]], None, None]:
+    """
+    Walk a directory tree level by level with walk_directory_levels.
+    A directory reached again through a junction cycle is not listed twice.
+    Args:
+        path_str (str): Starting directory path
+        start_depth (int): Depth of the starting directory
+        max_depth (int): Maximum depth of the listed entries
+    Yields:
+        Tuple[str, List[Dict[str, Any]]]: Directory path and the metadata of its entries
+    """
+    visited = {_directory_id(path_str, None)}
+    
+    def descend(entry: os.DirEntry, depth: int) -> bool:
+        try:
+            child_stat = entry.stat()
+        except OSError:
+            child_stat = None
         
-        if not parent_valid:
-            problems.extend(parent_problems)
+        dir_id = _directory_id(entry.path, child_stat)
+        if dir_id is not None and dir_id in visited:
+            return False
+        visited.add(dir_id)
+        return True
     
-    overall_valid = len(problems) == 0
+    for dir_path, entries, depth in walk_directory_levels(path_str, max_depth - start_depth - 1, descend):
+        level = start_depth + depth + 1
+        yield dir_path, [_child_metadata(entry, level, max_depth) for entry in entries]
+
+
+def iter_windows_metadata(path: PathString,
+                          max_depth: int = 10) -> Generator[Tuple[int, Dict[str, Any]], None, None]:
+    """
+    Lazily walk a directory tree without building the metadata hierarchy.
+    Only the current level is kept in memory; yielded entries have empty
+    children lists and file stats.
+    Args:
+        path (PathString): Starting directory path
+        max_depth (int): Maximum depth (default: 10)
+    Yields:
+        Tuple[int, Dict[str, Any]]: Depth and metadata of each entry below path
+    """
+    if max_depth < 1:
+        return
     
-    return overall_valid, problems
+    for _, children in _iter_child_metadata(str(path), 0, max_depth):
+        for child_metadata in children:
+            yield child_metadata["level"], child_metadata
 
 
 def collect_windows_metadata_recursive(path: PathString, max_depth: int = 10, 
                                        current_depth: int = 0) -> Dict[str, Any]:
     """
-    Recursively collect metadata from Windows file system hierarchy.
+    Collect metadata from Windows file system hierarchy.
+    Builds the tree from the same level-by-level walk as iter_windows_metadata.
     Args:
         path (PathString): Starting directory path
-        max_depth (int): Maximum recursion depth (default: 10)
-        current_depth (int): Current recursion level (internal use)
+        max_depth (int): Maximum depth (default: 10)
+        current_depth (int): Depth of the starting path (default: 0)
     Returns:
-        Dict[str, Any]: Hierarchical metadata with file stats, 
-                       children list, and performance metrics
+        Dict[str, Any]: Hierarchical metadata with file stats and children list,
+                       performance metrics on the root
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     if current_depth > max_depth:
         return {}
     
     path_str = str(path)
-    metadata = {
-        "path": path_str,
-        "name": os.path.basename(path_str) if os.path.basename(path_str) else path_str,
-        "type": "directory" if os.path.isdir(path_str) else "file",
-        "level": current_depth,
-        "hidden": is_hidden_windows_file(path_str),
-        "size": os.path.getsize(path_str) if os.path.isfile(path_str) else 0,
-        "children": [],
-        "file_stats": {
-            "total": 0,
-            "hidden": 0,
-            "by_extension": {}
-        }
-    }
     
-    if os.path.isdir(path_str) and current_depth < max_depth:
-        try:
-            for item in safe_windows_listdir(path_str):
-                item_path = os.path.join(path_str, item)
+    try:
+        stat_info = os.stat(path_str)
+    except OSError:
+        stat_info = None
+    is_dir = stat_info is not None and stat.S_ISDIR(stat_info.st_mode)
+    is_file = stat_info is not None and stat.S_ISREG(stat_info.st_mode)
+    
+    root = _metadata_node(path_str, os.path.basename(path_str) or path_str,
+                          is_dir, is_file, stat_info, current_depth)
+    root["recursion_depth"] = current_depth
+    
+    if is_dir and current_depth < max_depth:
+        pending = {path_str: root}
+        
+        for dir_path, children in _iter_child_metadata(path_str, current_depth, max_depth):
+            metadata = pending.pop(dir_path)
+            metadata["children"] = children
+            file_stats = metadata["file_stats"]
+            by_extension = file_stats["by_extension"]
+            
+            for child_metadata in children:
+                if child_metadata["type"] == "directory":
+                    if child_metadata["level"] < max_depth:
+                        pending[child_metadata["path"]] = child_metadata
+                    continue
                 
-                child_metadata = collect_windows_metadata_recursive(
-                    item_path, max_depth, current_depth + 1
-                )
+                file_stats["total"] += 1
                 
-                if child_metadata:
-                    metadata["children"].append(child_metadata)
-                    
-                    if child_metadata["type"] == "file":
-                        metadata["file_stats"]["total"] += 1
-                        
-                        if child_metadata["hidden"]:
-                            metadata["file_stats"]["hidden"] += 1
-                        
-                        _, ext = os.path.splitext(item)
-                        ext = ext.lower() if ext else "no_extension"
-                        metadata["file_stats"]["by_extension"][ext] = \
-                            metadata["file_stats"]["by_extension"].get(ext, 0) + 1
-                            
-        except (PermissionError, OSError):
-            pass
-
-    execution_time = time.time() - start_time
-    metadata["execution_time_ms"] = execution_time * 1000
-    metadata["recursion_depth"] = current_depth
+                if child_metadata["hidden"]:
+                    file_stats["hidden"] += 1
+                
+                _, ext = os.path.splitext(child_metadata["name"])
+                ext = ext.lower() if ext else "no_extension"
+                by_extension[ext] += 1
+
+    root["execution_time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
     
-    return metadata
+    return root
 
 
 def resolve_long_paths_recursive(path: PathString, prefix: str = "\\\\?\\") -> str:
     """
-    Recursively convert Windows paths exceeding 260-character limit.
+    Convert Windows paths exceeding 260-character limit.
+    A parent is never longer than its child, so only the full path length matters.
     Args:
         path (PathString): Path to process
         prefix (str): Long path prefix (default: "\\\\?\\")
@@ -249,24 +598,10 @@ def resolve_long_paths_recursive(path: PathString, prefix: str = "\\\\?\\") -> s
     """
     path_str = str(path)
     
-    if len(path_str) > 260:
-        if path_str.startswith("\\\\"):
-            if not path_str.startswith("\\\\?\\UNC\\"):
-                return "\\\\?\\UNC\\" + path_str[2:]
-        elif not path_str.startswith("\\\\?\\"):
-            return prefix + path_str
-        else:
-            return path_str
-    
-    parent = get_parent_path(path_str)
-    
-    if not parent or parent == path_str:
+    if len(path_str) <= 260 or path_str.startswith("\\\\?\\"):
         return path_str
     
-    resolved_parent = resolve_long_paths_recursive(parent, prefix)
-    
-    if resolved_parent != parent:
-        current_name = os.path.basename(path_str)
-        return os.path.join(resolved_parent, current_name)
+    if path_str.startswith("\\\\"):
+        return "\\\\?\\UNC\\" + path_str[2:]
     
-    return path_str
\ No newline at end of file
+    return prefix + path_str
\ No newline at end of file